@@ -0,0 +1,96 @@
+import argparse
+import io
+import sys
+import time
+
+import jft_engine
+
+# Küçük GIF kipindeki kare çözümleme hızını ölçer: palete eşleme, değişen
+# dikdörtgen ve değişmeyen piksel maskesi. NumPy ve Pillow yolları aynı
+# karelerle karşılaştırılır.
+#
+#   python bench_frames.py -n 48 --size 1920x1080
+#
+# Kareler sabit bir doku üzerinde kayan bir dikdörtgenden oluşur; ekran
+# kaydı ve kaydetme geçmişi karelerine benzer şekilde az bölge değişir.
+# Ölçümden önce her yolun OptimizedGifWriter çıktısı Pillow ile çözülür ve
+# her kare kaynağın palete eşlenmiş haliyle karşılaştırılır; iki yolun
+# birbiriyle uyuşması yetmez. Fark varsa çıkış kodu 1'dir.
+
+
+def make_frames(count, size):
+    from PIL import Image, ImageDraw
+
+    width, height = size
+    base = Image.effect_noise(size, 64).convert('RGB')
+    frames = []
+    for n in range(count):
+        frame = base.copy()
+        left = n * 24 % max(width - 200, 1)
+        ImageDraw.Draw(frame).rectangle((left, height // 3, left + 200, height // 3 + 200), fill=(255, 64, 0))
+        frames.append(frame)
+    return frames
+
+
+def check_output(frames, palette, chunk_size, use_numpy):
+    # Yazılan GIF'in her karesi kaynağın palete eşlenmiş haliyle piksel piksel
+    # aynı olmalıdır; ilk farklı karenin sırası döner, yoksa None
+    from PIL import Image, ImageChops
+
+    buffered = io.BytesIO()
+    with jft_engine.OptimizedGifWriter(buffered, chunk_size=chunk_size, use_numpy=use_numpy) as writer:
+        writer.palette = palette
+        for frame in frames:
+            writer.write(frame, 100)
+    with Image.open(io.BytesIO(buffered.getvalue())) as gif:
+        for n, frame in enumerate(frames):
+            gif.seek(n)
+            expected = frame.quantize(palette=palette, dither=Image.Dither.NONE).convert('RGB')
+            if ImageChops.difference(gif.convert('RGB'), expected).getbbox():
+                return n
+    return None
+
+
+def run(frames, palette, chunk_size, use_numpy):
+    analyzer = jft_engine.FrameAnalyzer(palette, jft_engine.OptimizedGifWriter.TRANSPARENT,
+                                        chunk_size, use_numpy=use_numpy)
+    start = time.perf_counter()
+    previous = None
+    for offset in range(0, len(frames), analyzer.chunk_size):
+        results = analyzer.analyze(frames[offset:offset + analyzer.chunk_size], previous)
+        previous = results[-1][0]
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure optimized-GIF frame analysis.")
+    parser.add_argument('-n', '--frames', type=int, default=48, help="number of frames")
+    parser.add_argument('--size', default='1920x1080', help="frame size, WIDTHxHEIGHT")
+    parser.add_argument('--chunk', type=int, help="frames analyzed per NumPy batch")
+    args = parser.parse_args(argv)
+
+    size = tuple(int(part) for part in args.size.lower().split('x'))
+    frames = make_frames(args.frames, size)
+    palette = jft_engine.build_gif_palette(frames[:jft_engine.PALETTE_SAMPLES])
+
+    paths = [('pillow', False)]
+    if jft_engine._load_numpy() is not None:
+        paths.append(('numpy', True))
+    for label, use_numpy in paths:
+        mismatch = check_output(frames, palette, args.chunk, use_numpy)
+        if mismatch is not None:
+            print(f"{label:<7} frame {mismatch} does not match its source")
+            return 1
+    print("output  matches the source frames")
+    pillow = run(frames, palette, args.chunk, False)
+    print(f"pillow  {pillow / len(frames) * 1000:7.2f} ms/frame")
+    if jft_engine._load_numpy() is None:
+        print("numpy   skipped (not installed)")
+        return 0
+    vectorized = run(frames, palette, args.chunk, True)
+    print(f"numpy   {vectorized / len(frames) * 1000:7.2f} ms/frame   {pillow / vectorized:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Ana menünün açılış süresini ölçer. Her çalıştırma yeni bir yorumlayıcıda
+# yapılır; süre, süreç başlangıcından menü çizilene kadar geçen zamandır.
+#
+#   python bench_startup.py -n 20
+#
+# Ekran yoksa (ör. CI) yalnızca içe aktarma süresi ölçülür.
+
+HEAVY_MODULES = ('PIL', 'json', 'subprocess', 'pickle', 'base64', 'multiprocessing',
+                 'concurrent.futures', 'tempfile', 'shutil')
+
+_CHILD = r'''
+import sys, time
+start = time.perf_counter()
+import jft
+imported = time.perf_counter()
+menu = None
+try:
+    app = jft.Application()
+    app.update()
+    menu = time.perf_counter()
+    app.destroy()
+except jft.tk.TclError:
+    pass
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(imported - start, menu - start if menu else -1, ','.join(loaded))
+'''
+
+
+def run_once(directory):
+    # -X importtime gibi seçenekler olmadan, kullanıcı ortamındaki gibi çalışır
+    code = _CHILD.format(heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], cwd=directory, check=True,
+                            capture_output=True, text=True).stdout.split()
+    imported, menu = float(output[0]), float(output[1])
+    loaded = output[2].split(',') if len(output) > 2 else []
+    return imported, (menu if menu >= 0 else None), loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure JFT time-to-main-menu.")
+    parser.add_argument('-n', '--runs', type=int, default=10, help="number of cold starts")
+    args = parser.parse_args(argv)
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    imports, menus, loaded = [], [], set()
+    for _ in range(args.runs):
+        imported, menu, modules = run_once(directory)
+        imports.append(imported)
+        if menu is not None:
+            menus.append(menu)
+        loaded.update(modules)
+
+    def report(label, values):
+        print(f"{label:<16} min {min(values) * 1000:7.1f} ms   median {statistics.median(values) * 1000:7.1f} ms")
+
+    report("import jft", imports)
+    if menus:
+        report("main menu", menus)
+    else:
+        print("main menu        skipped (no display)")
+    if loaded:
+        print("heavy modules loaded at startup:", ', '.join(sorted(loaded)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
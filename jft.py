@@ -1,21 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 from tkinterdnd2 import DND_FILES, TkinterDnD
-import base64
-import json
-import datetime
 import os
-import io
+import sys
 import threading
 import re
 import platform
-import subprocess
 import string
-from PIL import Image, ImageTk
-import pickle
-import tempfile
-import shutil
 import time
+import itertools
+import bisect
+import operator
+import queue
+import collections
+import io
+import jft_engine
+
+# PIL ve subprocess ana menünün açılışını yavaşlatmasın
+# diye ilk gerektikleri yerde içe aktarılır (bkz. bench_startup.py).
 
 class CenteredDialog:
     def center_window(self):
@@ -130,48 +132,97 @@ class CustomIntegerDialog(tk.Toplevel, CenteredDialog):
         except ValueError:
             messagebox.showerror("Invalid Input", f"Please enter a valid integer between {self.min_value} and {self.max_value}.")
 
+class ExportOptionsDialog(tk.Toplevel, CenteredDialog):
+    def __init__(self, parent, options):
+        super().__init__(parent)
+        self.title("Export Options")
+        self.resizable(False, False)
+        self.result = None
+
+        self.format = tk.StringVar(value=options.format)
+        self.compress_level = tk.IntVar(value=options.compress_level)
+        self.optimize = tk.BooleanVar(value=options.optimize)
+        self.passthrough = tk.BooleanVar(value=options.passthrough)
+        self.quality = tk.IntVar(value=options.quality)
+        self.keep_alpha = tk.BooleanVar(value=options.keep_alpha)
+
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill='both', expand=True)
+
+        ttk.Label(frame, text="Frame format:").grid(column=0, row=0, sticky=tk.W, pady=2)
+        ttk.Combobox(frame, textvariable=self.format, values=jft_engine.ExportOptions.FORMATS,
+                     state='readonly', width=8).grid(column=1, row=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text="PNG compression (0-9):").grid(column=0, row=1, sticky=tk.W, pady=2)
+        ttk.Spinbox(frame, from_=0, to=9, textvariable=self.compress_level, width=6).grid(column=1, row=1, sticky=tk.W, pady=2)
+        ttk.Label(frame, text="WebP/JPEG quality (1-100):").grid(column=0, row=2, sticky=tk.W, pady=2)
+        ttk.Spinbox(frame, from_=1, to=100, textvariable=self.quality, width=6).grid(column=1, row=2, sticky=tk.W, pady=2)
+        ttk.Checkbutton(frame, text="Optimize (slower, smaller)",
+                        variable=self.optimize).grid(column=0, row=3, columnspan=2, sticky=tk.W, pady=2)
+        ttk.Checkbutton(frame, text="Copy PNG files without re-encoding",
+                        variable=self.passthrough).grid(column=0, row=4, columnspan=2, sticky=tk.W, pady=2)
+        ttk.Checkbutton(frame, text="Keep transparency (PNG/WebP)",
+                        variable=self.keep_alpha).grid(column=0, row=5, columnspan=2, sticky=tk.W, pady=2)
+
+        button_frame = ttk.Frame(self)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text="OK", command=self.on_ok).pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT)
+
+        self.bind("<Return>", self.on_ok)
+        self.bind("<Escape>", lambda e: self.destroy())
+
+        self.center_window()
+
+    def on_ok(self, event=None):
+        try:
+            compress_level = self.compress_level.get()
+            quality = self.quality.get()
+            if not (0 <= compress_level <= 9 and 1 <= quality <= 100):
+                raise ValueError
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Invalid Input", "Compression must be 0-9 and quality 1-100.")
+            return
+        self.result = jft_engine.ExportOptions(self.format.get(), compress_level, self.optimize.get(),
+                                               self.passthrough.get(), quality, self.keep_alpha.get())
+        self.destroy()
+
 class GifPreviewWindow(tk.Toplevel):
-    def __init__(self, master, gif_path):
+    # Bir GIF dosyasını ya da doğrudan dönüşüm kaynağını oynatır; frames,
+    # (kare, süre) çiftleri üreten yeni bir yineleyici döndüren bir işlevdir.
+    def __init__(self, master, gif_path=None, frames=None):
         super().__init__(master)
         self.title("GIF Preview")
         self.gif_path = gif_path
+        self.frames = frames or (lambda: jft_engine.iter_gif_frames(gif_path))
         self.result = None
-        self.gif = None  # GIF dosyasını tutacak değişken
+        self.player = None  # kareleri arka planda çözen PreviewFrames
+        self.photo = None
+        self._after_id = None
 
-        self.load_gif()
+        try:
+            self.load_gif()
+        except Exception:
+            self.destroy()
+            raise
         self.create_widgets()
         self.center_window()
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
 
     def load_gif(self):
-        self.gif = Image.open(self.gif_path)
-        self.frames = []
-        try:
-            while True:
-                self.frames.append(ImageTk.PhotoImage(self.gif.copy()))
-                self.gif.seek(len(self.frames))
-        except EOFError:
-            pass
+        # Yalnızca ilk kare çözülür; diğerleri oynatılırken çözülür
+        first = next(iter(self.frames()), None)
+        if first is None:
+            raise ValueError("No frames to preview.")
+        self.gif_size = first[0].size
 
     def create_widgets(self):
-        # GIF'in boyutlarını al
-        width, height = self.gif.size
-        
-        # Ekran boyutlarını al
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        
-        # Maksimum pencere boyutunu belirle (ekranın %80'i)
-        max_width = int(screen_width * 0.8)
-        max_height = int(screen_height * 0.8)
-        
-        # Eğer GIF boyutu maksimum boyuttan büyükse, oranı koru ve küçült
-        if width > max_width or height > max_height:
-            ratio = min(max_width / width, max_height / height)
-            width = int(width * ratio)
-            height = int(height * ratio)
+        # Maksimum pencere boyutu ekranın %80'i; GIF büyükse oran korunarak küçültülür
+        max_size = (int(self.winfo_screenwidth() * 0.8), int(self.winfo_screenheight() * 0.8))
+        width, height = jft_engine.fit_size(self.gif_size, max_size)
 
         self.canvas = tk.Canvas(self, width=width, height=height)
         self.canvas.pack()
+        self.image_item = self.canvas.create_image(width // 2, height // 2)
 
         button_frame = ttk.Frame(self)
         button_frame.pack(pady=10)
@@ -179,16 +230,23 @@ class GifPreviewWindow(tk.Toplevel):
         ttk.Button(button_frame, text="Save", command=self.save).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT, padx=5)
 
-        self.current_frame = 0
+        self.player = jft_engine.PreviewFrames(self.frames, (width, height)).start()
         self.show_frame()
 
     def show_frame(self):
-        frame = self.frames[self.current_frame]
-        self.canvas.delete("all")
-        self.canvas.create_image(self.canvas.winfo_width()//2, self.canvas.winfo_height()//2, image=frame)
-        
-        self.current_frame = (self.current_frame + 1) % len(self.frames)
-        self.after(self.gif.info.get('duration', 100), self.show_frame)  # Default to 100ms if duration not specified
+        from PIL import ImageTk
+        self._after_id = None
+        item = self.player.next_frame()
+        if item is None:
+            # Okuma henüz yetişmedi; animasyon bittiyse son kare ekranda kalır
+            if not self.player.done:
+                self._after_id = self.after(10, self.show_frame)
+            return
+        frame, duration = item
+        self.photo = ImageTk.PhotoImage(frame)
+        self.canvas.itemconfigure(self.image_item, image=self.photo)
+        # Tekrarlanan kareler tek kare olarak yazıldığı için her karenin kendi süresi kullanılır
+        self._after_id = self.after(duration or 100, self.show_frame)
 
     def save(self):
         self.result = True
@@ -201,11 +259,13 @@ class GifPreviewWindow(tk.Toplevel):
         self.destroy()
 
     def cleanup(self):
-        # GIF dosyasını kapat
-        if self.gif:
-            self.gif.close()
-        # Frames'i temizle
-        self.frames.clear()
+        # Oynatmayı durdur; arka plandaki okuyucu GIF dosyasını kendisi kapatır
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        if self.player:
+            self.player.close()
+        self.photo = None
 
     def center_window(self):
         self.update_idletasks()
@@ -215,16 +275,561 @@ class GifPreviewWindow(tk.Toplevel):
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry('{}x{}+{}+{}'.format(width, height, x, y))
 
+class FileRecord:
+    __slots__ = ('item', 'path', '_filename', 'sort_key', 'repeat', 'note')
+
+    def __init__(self, item, path, filename, repeat=1, note=''):
+        self.item = item
+        self.path = path
+        self.filename = filename
+        self.repeat = repeat
+        self.note = note
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @filename.setter
+    def filename(self, value):
+        # Doğal sıralama anahtarı yalnızca ad değiştiğinde hesaplanır
+        self._filename = value
+        self.sort_key = jft_engine.natural_sort_key(value)
+
+
+_record_sort_key = operator.attrgetter('sort_key')
+
+
+class FileRegistry:
+    # Kayıtları sıralı tutar ve kayıt kimliğinden kayda O(1) erişim sağlar.
+    # Kimlikler, görünür satırlarda Treeview öğe kimliği olarak da kullanılır.
+    def __init__(self, records=()):
+        self._records = []
+        self._index = {}
+        self._ids = itertools.count(1)
+        self.extend(records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def get(self, item):
+        return self._index.get(item)
+
+    def append(self, record):
+        if record.item is None:
+            record.item = f"R{next(self._ids)}"
+        self._records.append(record)
+        self._index[record.item] = record
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def insert_sorted(self, records):
+        # Sıralı listeye ekler; az sayıda kayıt ikili aramayla yerine konur,
+        # büyük gruplarda tek bir (çoğunlukla sıralı veride doğrusal) sıralama yapılır.
+        records = sorted(records, key=_record_sort_key)
+        if len(records) > 64 and len(records) * 8 > len(self._records):
+            self.extend(records)
+            self.sort()
+            return
+        lo = 0
+        for record in records:
+            if record.item is None:
+                record.item = f"R{next(self._ids)}"
+            lo = bisect.bisect_right(self._records, record.sort_key, lo, key=_record_sort_key)
+            self._records.insert(lo, record)
+            self._index[record.item] = record
+            lo += 1
+
+    def bisect(self, filename):
+        return bisect.bisect_right(self._records, jft_engine.natural_sort_key(filename), key=_record_sort_key)
+
+    def remove_items(self, items):
+        # Tek geçişte siler; silinen kayıtları liste sırasıyla döndürür
+        items = {item for item in items if item in self._index}
+        if not items:
+            return []
+        removed = []
+        kept = []
+        for record in self._records:
+            (removed if record.item in items else kept).append(record)
+        self._records = kept
+        for item in items:
+            del self._index[item]
+        return removed
+
+    def clear(self):
+        self._records = []
+        self._index = {}
+
+    def sort(self, key=_record_sort_key):
+        self._records.sort(key=key)
+
+
+class VirtualTreeview:
+    # Treeview'da yalnızca görünen satırları tutar; kaydırma çubuğu konumu
+    # kayıt listesi üzerindeki bir pencereye eşlenir. Seçim, ekran dışındaki
+    # satırlar için de kayıt kimlikleriyle saklanır.
+    DEFAULT_ROW_HEIGHT = 20
+    DEFAULT_HEADER_HEIGHT = 25
+
+    def __init__(self, tree, scrollbar, records, row_values, on_scroll=None, row_image=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.records = records
+        self.row_values = row_values
+        self.on_scroll = on_scroll
+        self.row_image = row_image  # ağaç sütunundaki resim; None ise resim gösterilmez
+        self.top = 0
+        self.rows = 1
+        self.height = 0
+        self.selected = set()
+        self.anchor = None  # Shift ile seçimde başlangıç satırının indeksi
+        self.cursor = None
+
+        scrollbar.configure(command=self.yview)
+        tree.bind('<Configure>', self._on_configure)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        tree.bind('<Button-5>', lambda event: self.scroll(3))
+        tree.bind('<Up>', lambda event: self.move_cursor(-1, event))
+        tree.bind('<Down>', lambda event: self.move_cursor(1, event))
+        tree.bind('<Prior>', lambda event: self.move_cursor(-self.rows, event))
+        tree.bind('<Next>', lambda event: self.move_cursor(self.rows, event))
+        tree.bind('<Home>', lambda event: self.move_cursor(-len(self.records), event))
+        tree.bind('<End>', lambda event: self.move_cursor(len(self.records), event))
+
+    def refresh(self):
+        count = len(self.records)
+        self.top = max(0, min(self.top, count - self.rows))
+        window = [self.records[i] for i in range(self.top, min(self.top + self.rows, count))]
+        # Pencereden çıkan satırlar silinir; kalanlar yalnızca yeri değiştiyse taşınır
+        wanted = {record.item for record in window}
+        order = list(self.tree.get_children())
+        stale = [item for item in order if item not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            order = [item for item in order if item in wanted]
+        present = set(order)
+        for index, record in enumerate(window):
+            if record.item not in present:
+                self.tree.insert('', index, iid=record.item, **self._row_options(record))
+                order.insert(index, record.item)
+                continue
+            if order[index] != record.item:
+                self.tree.move(record.item, '', index)
+                order.remove(record.item)
+                order.insert(index, record.item)
+            self.tree.item(record.item, **self._row_options(record))
+        self._show_selection([record.item for record in window if record.item in self.selected])
+        self.tree.yview_moveto(0)
+        if count:
+            self.scrollbar.set(self.top / count, min(self.top + self.rows, count) / count)
+        else:
+            self.scrollbar.set(0, 1)
+        self._update_rows()
+
+    def refresh_row(self, record):
+        if self.tree.exists(record.item):
+            self.tree.item(record.item, **self._row_options(record))
+
+    def _row_options(self, record):
+        options = {'values': self.row_values(record)}
+        if self.row_image:
+            options['image'] = self.row_image(record)
+        return options
+
+    def index_of(self, item):
+        # Görünen satırlar için sabit zamanlı; aksi halde doğrusal arama
+        for offset, child in enumerate(self.tree.get_children()):
+            if child == item:
+                return self.top + offset
+        for index, record in enumerate(self.records):
+            if record.item == item:
+                return index
+        return None
+
+    def selection(self):
+        return [record.item for record in self.records if record.item in self.selected]
+
+    def select(self, items):
+        self.selected = set(items)
+        self._show_selection([item for item in self.tree.get_children() if item in self.selected])
+
+    def _show_selection(self, items):
+        # selection_set <<TreeviewSelect>> üretir ve açık not düzenleyicisini
+        # kapatır; görünen seçim aynıysa çağrılmaz
+        if set(items) != set(self.tree.selection()):
+            self.tree.selection_set(items)
+
+    def select_all(self):
+        self.select(record.item for record in self.records)
+
+    def click(self, event):
+        item = self.tree.identify('item', event.x, event.y)
+        if not item or self.tree.identify_region(event.x, event.y) not in ('cell', 'tree'):
+            return None
+        self.tree.focus_set()
+        index = self.index_of(item)
+        if event.state & 0x0001 and self.anchor is not None:  # Shift
+            self._select_range(self.anchor, index)
+        elif event.state & 0x0004:  # Control
+            self.selected ^= {item}
+            self.anchor = index
+            self.select(self.selected)
+        else:
+            self.anchor = index
+            self.select([item])
+        self.cursor = index
+        return 'break'
+
+    def move_cursor(self, delta, event=None):
+        count = len(self.records)
+        if not count:
+            return 'break'
+        index = self.cursor if self.cursor is not None else self.top
+        index = max(0, min(index + delta, count - 1))
+        if event is not None and event.state & 0x0001 and self.anchor is not None:
+            self._select_range(self.anchor, index)
+        else:
+            self.anchor = index
+            self.selected = {self.records[index].item}
+        self.cursor = index
+        self.see(index)
+        return 'break'
+
+    def see(self, index):
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.rows:
+            self.top = index - self.rows + 1
+        self._scrolled()
+
+    def scroll(self, delta):
+        self.top += delta
+        self._scrolled()
+        return 'break'
+
+    def yview(self, *args):
+        count = len(self.records)
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * count)
+        elif args[0] == 'scroll':
+            step = self.rows if args[2] == 'pages' else 1
+            self.top += int(args[1]) * step
+        self._scrolled()
+
+    def _select_range(self, start, end):
+        if start > end:
+            start, end = end, start
+        self.select(self.records[i].item for i in range(start, end + 1))
+
+    def _scrolled(self):
+        if self.on_scroll:
+            self.on_scroll()
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        # Windows'ta delta 120'nin katlarıdır, macOS'ta küçük değerlerdir
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-3 * delta)
+
+    def _on_configure(self, event):
+        self.height = event.height
+        self._update_rows()
+
+    def _update_rows(self):
+        # Satır yüksekliği ilk görünen satırdan ölçülür
+        if not self.height:
+            return
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else None
+        if bbox:
+            header, row_height = bbox[1], bbox[3]
+        else:
+            header, row_height = self.DEFAULT_HEADER_HEIGHT, self.DEFAULT_ROW_HEIGHT
+        rows = max(1, (self.height - header) // max(row_height, 1))
+        if rows != self.rows:
+            self.rows = rows
+            self.refresh()
+
+
+class ThumbnailLoader:
+    # Satır küçük resimlerini arka plan işçileriyle hazırlar. image() yalnızca
+    # görünen satırlar için çağrılır; eksik olanlar en son istenen önce
+    # yüklenir ve kaydırılıp geçilen eski istekler MAX_PENDING'i aşınca
+    # düşürülür. PhotoImage'lar Tk iş parçacığında oluşturulur ve sınırlı
+    # bir LRU'da tutulur.
+    POLL_MS = 50
+    MAX_PENDING = 256
+    MEMORY_IMAGES = 512
+
+    def __init__(self, widget, cache, on_ready, workers=2):
+        self.widget = widget
+        self.cache = cache
+        self.on_ready = on_ready
+        self.workers = workers
+        self.images = collections.OrderedDict()  # yol -> PhotoImage ('' ise üretilemedi)
+        self._requested = set()
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Semaphore(0)
+        self._results = queue.Queue()
+        self._threads = []
+        self._polling = False
+        self._closed = False
+        widget.bind('<Destroy>', self._on_destroy, add='+')
+
+    def image(self, path):
+        image = self.images.get(path)
+        if image is not None:
+            self.images.move_to_end(path)
+            return image
+        if path not in self._requested:
+            self._requested.add(path)
+            with self._lock:
+                self._pending.append(path)
+                dropped = self._pending.popleft() if len(self._pending) > self.MAX_PENDING else None
+            if dropped is not None:
+                self._requested.discard(dropped)
+            self._start()
+            self._wake.release()
+        return ''
+
+    def close(self):
+        self._closed = True
+        for _ in self._threads:
+            self._wake.release()
+
+    def _start(self):
+        if not self._threads:
+            for _ in range(self.workers):
+                thread = threading.Thread(target=self._work, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.POLL_MS, self._poll)
+
+    def _work(self):
+        # İşçi iş parçacığı: Tk'ye dokunmaz
+        while True:
+            self._wake.acquire()
+            if self._closed:
+                return
+            with self._lock:
+                path = self._pending.pop() if self._pending else None
+            if path is None:
+                continue
+            try:
+                data = self.cache.get(path)
+            except Exception:
+                data = None
+            self._results.put((path, data))
+
+    def _poll(self):
+        from PIL import Image, ImageTk
+
+        if self._closed:
+            return
+        ready = False
+        try:
+            while True:
+                path, data = self._results.get_nowait()
+                self._requested.discard(path)
+                try:
+                    with Image.open(io.BytesIO(data)) as thumb:
+                        self.images[path] = ImageTk.PhotoImage(thumb)
+                except Exception:
+                    self.images[path] = ''
+                ready = True
+        except queue.Empty:
+            pass
+        while len(self.images) > self.MEMORY_IMAGES:
+            self.images.popitem(last=False)
+        if ready:
+            self.on_ready()
+        if self._requested:
+            self.widget.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def _on_destroy(self, event):
+        if event.widget is self.widget:
+            self.close()
+
+
+class IngestJob:
+    # Bırakılan dosya ve klasörleri arka planda genişletir ve doğrular;
+    # sonuçlar kuyruk üzerinden parça parça Tk iş parçacığına iletilir.
+    def __init__(self, paths, list_directory, is_valid, sort_key, batch_size=500, workers=8):
+        self.paths = paths
+        self.list_directory = list_directory
+        self.is_valid = is_valid
+        self.sort_key = sort_key
+        self.batch_size = batch_size
+        self.workers = workers
+        self.queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _run(self):
+        try:
+            # Doğal sıralama bir kez, arka planda yapılır
+            # Adaylar (yol, stat) çiftleridir; klasör taramasının stat bilgisi yeniden kullanılır
+            candidates = []
+            for path in sorted(self.paths, key=lambda p: self.sort_key(os.path.basename(p))):
+                if self.cancel_event.is_set():
+                    break
+                if os.path.isdir(path):
+                    candidates.extend((entry.path, entry) for entry in self.list_directory(path, self.cancel_event))
+                else:
+                    candidates.append((path, None))
+            self.queue.put(('total', len(candidates)))
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for start in range(0, len(candidates), self.batch_size):
+                    if self.cancel_event.is_set():
+                        break
+                    batch = candidates[start:start + self.batch_size]
+                    results = list(executor.map(lambda candidate: self.is_valid(*candidate), batch))
+                    valid = [path for (path, _), ok in zip(batch, results) if ok]
+                    invalid = [path for (path, _), ok in zip(batch, results) if not ok]
+                    self.queue.put(('batch', valid, invalid, start + len(batch)))
+        except Exception as e:
+            self.queue.put(('error', e))
+        finally:
+            self.queue.put(('done', self.cancel_event.is_set()))
+
+
+class ProgressChannel:
+    # Arka plan işçileri olayları kuyruğa koyar; Tk döngüsü kuyruğu
+    # zamanlayıcıyla boşaltır. İşçiler ilerlemeyi en fazla INTERVAL_MS'de
+    # bir gönderir, böylece kare döngüsünde Tk çağrısı yapılmaz.
+    INTERVAL_MS = 33
+
+    def __init__(self, widget, on_progress):
+        self.widget = widget
+        self.on_progress = on_progress
+        self.queue = queue.Queue()
+        self.active = 0
+        # İşçi tarafı durum
+        self._total = 0
+        self._last_sent = 0.0
+        # Tk tarafı durum
+        self.total = 0
+        self.template = ""
+        self.started = 0.0
+
+    # --- İşçi iş parçacığından çağrılır ---
+
+    def start(self, total, status, template):
+        self._total = total
+        self._last_sent = 0.0
+        self.queue.put(('start', total, status, template, time.monotonic()))
+
+    def advance(self, done):
+        now = time.monotonic()
+        if done >= self._total or now - self._last_sent >= self.INTERVAL_MS / 1000:
+            self._last_sent = now
+            self.queue.put(('progress', done))
+
+    def status(self, status, value=100):
+        self.queue.put(('status', value, status))
+
+    def call(self, fn):
+        # fn Tk iş parçacığında çalıştırılır
+        self.queue.put(('call', fn))
+
+    def finish(self):
+        self.queue.put(('finish',))
+
+    # --- Tk iş parçacığından çağrılır ---
+
+    def begin(self):
+        self.active += 1
+        if self.active == 1:
+            self.widget.after(self.INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        if not self.widget.winfo_exists():
+            return
+        latest = None
+        try:
+            while True:
+                try:
+                    event = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event[0] == 'progress':
+                    # Aynı turdaki ilerleme olaylarından yalnızca sonuncusu gösterilir
+                    latest = event[1]
+                    continue
+                if latest is not None:
+                    self._show_progress(latest)
+                    latest = None
+                if event[0] == 'start':
+                    _, self.total, status, self.template, self.started = event
+                    self.on_progress(0, status)
+                elif event[0] == 'status':
+                    self.on_progress(event[1], event[2])
+                elif event[0] == 'call':
+                    # Modal pencereler bu döngüyü bekletmesin diye boşta çalıştırılır
+                    self.widget.after_idle(event[1])
+                elif event[0] == 'finish':
+                    self.active -= 1
+                    self.on_progress(0, "")
+            if latest is not None:
+                self._show_progress(latest)
+        finally:
+            if self.active > 0 or not self.queue.empty():
+                self.widget.after(self.INTERVAL_MS, self._poll)
+
+    def _show_progress(self, done):
+        status = self.template.format(done=done, total=self.total)
+        elapsed = time.monotonic() - self.started
+        if done and elapsed > 0:
+            rate = done / elapsed
+            remaining = int((self.total - done) / rate)
+            status += f" ({rate:.1f}/s, ETA {remaining // 60}:{remaining % 60:02d})"
+        self.on_progress(done / self.total * 100 if self.total else 0, status)
+
+
 class BaseConverter:
+    SESSION_BATCH_SIZE = 500
+    file_patterns = None  # Klasör taramasında eşleşecek glob desenleri; None: tüm dosyalar
+    INGEST_POLL_MS = 50
+
     def __init__(self, master):
         self.master = master
-        self.files = []
+        self.files = FileRegistry()
         self.sort_order = True
         self.undo_stack = []
         self.conflict_resolution = None
         self.apply_to_all = False
         self.text_editors = {}
         self.current_session_file = None
+        self.session_loader = None
+        self.ingest_job = None
+        self.pending_drops = []
+        self.conversion_cancel = None  # dönüşüm sürerken threading.Event
         self.create_widgets()
         self.bind_shortcuts()
         self.file_counter = 0
@@ -256,9 +861,12 @@ class BaseConverter:
         self.frame.grid_columnconfigure(0, weight=1)
         self.frame.grid_rowconfigure(1, weight=1)
 
-        scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.tree.yview)
+        scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL)
         scrollbar.grid(column=1, row=1, sticky=(tk.N, tk.S))
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # Büyük listelerde yalnızca görünen satırlar Treeview'a eklenir
+        self.view = VirtualTreeview(self.tree, scrollbar, self.files,
+                                    lambda record: self.row_values(record),
+                                    on_scroll=self.hide_text_editor)
 
         self.tree.bind('<BackSpace>', self.remove_selected)
         self.tree.bind('<Button-1>', self.on_click)
@@ -267,19 +875,26 @@ class BaseConverter:
         self.progress = ttk.Progressbar(self.frame, orient=tk.HORIZONTAL, length=300, mode='determinate')
         self.progress.grid(column=0, row=2, sticky=(tk.W, tk.E), pady=5)
 
+        # Yalnızca arka planda dosya eklenirken veya dönüşüm sürerken görünür
+        self.cancel_button = ttk.Button(self.frame, text="Cancel", command=self.cancel_work)
+        self.cancel_button.grid(column=0, row=2, sticky=tk.E, pady=5)
+        self.cancel_button.grid_remove()
+
         self.status_label = ttk.Label(self.frame, text="")
         self.status_label.grid(column=0, row=3, sticky=(tk.W, tk.E))
+        self.progress_channel = ProgressChannel(self.frame, self.update_progress)
 
         self.tree.drop_target_register(DND_FILES)
         self.tree.dnd_bind('<<Drop>>', self.drop)
 
     def bind_events(self):
+        self.tree.bind('<Escape>', self.cancel_work)
         self.tree.bind('<Delete>', self.remove_selected)
         self.tree.bind('<Control-a>', self.select_all)
         self.master.bind('<Control-A>', self.select_all)  # Büyük harf için
 
     def select_all(self, event=None):
-        self.tree.selection_set(self.tree.get_children())
+        self.view.select_all()
         return 'break'  # Varsayılan işlemi engelle
     
     def save_session(self):
@@ -289,51 +904,136 @@ class BaseConverter:
             save_path = filedialog.asksaveasfilename(defaultextension=".jft", filetypes=[("JFT files", "*.jft")])
         
         if save_path:
-            session_data = {
-                'files': self.files,
-                'sort_order': self.sort_order,
-                'converter_type': self.__class__.__name__
-            }
-            with open(save_path, 'wb') as f:
-                pickle.dump(session_data, f)
+            try:
+                jft_engine.write_session(save_path,
+                                         [jft_engine.SessionRecord(record.path, record.filename,
+                                                                   int(record.repeat), record.note,
+                                                                   metadata=self.record_metadata(record))
+                                          for record in self.files],
+                                         converter_type=self.__class__.__name__,
+                                         sort_order=self.sort_order,
+                                         file_counter=self.file_counter)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to save session: {str(e)}")
+                return
             self.current_session_file = save_path
             messagebox.showinfo("Başarılı", "Oturum başarıyla kaydedildi.")
             self.changes_made = False
 
     def load_session(self, filename):
-        with open(filename, 'rb') as f:
-            session_data = pickle.load(f)
-        self.files = session_data['files']
-        self.sort_order = session_data['sort_order']
+        try:
+            reader = jft_engine.SessionReader(filename)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Failed to load session: {str(e)}")
+            return
+
+        converter_type = reader.header.get('converter_type')
+        if converter_type and converter_type != self.__class__.__name__:
+            reader.close()
+            messagebox.showerror("Error", "This session was saved by a different converter.")
+            return
+
+        self.files.clear()
+        self.view.select([])
+        self.view.top = 0
+        self.view.refresh()
+        self.undo_stack.clear()
+        self.sort_order = reader.header.get('sort_order', True)
+        self.file_counter = reader.header.get('file_counter', 0)
         self.current_session_file = filename
-        self.update_treeview()
         self.changes_made = False
 
-    def update_treeview(self):
-        self.tree.delete(*self.tree.get_children())
-        for item, path, filename, *rest in self.files:
-            values = [filename] + rest
-            new_item = self.tree.insert('', 'end', values=values)
-            self.files[self.files.index((item, path, filename, *rest))] = (new_item, path, filename, *rest)
-        self.sort_items()
+        # İlk satırlar hemen gösterilir, kalanı olay döngüsünde parça parça yüklenir
+        self.session_loader = [reader, reader.records(), 0]
+        self._load_session_batch(self.session_loader)
+
+    def _load_session_batch(self, loader):
+        if loader is not self.session_loader or not self.frame.winfo_exists():
+            loader[0].close()
+            return
+
+        reader, records, loaded = loader
+        try:
+            batch = []
+            for record in itertools.islice(records, self.SESSION_BATCH_SIZE):
+                if record.metadata_span:
+                    self.restore_metadata(record.path, reader.read_blob(record.metadata_span))
+                batch.append(FileRecord(None, record.path, record.filename, record.repeat, record.note))
+            loaded += len(batch)
+            self._insert_records(batch)
+            self.file_counter = max([self.file_counter] + [self.file_number(record.filename) for record in batch])
+        except (OSError, ValueError) as e:
+            self.session_loader = None
+            reader.close()
+            self.status_label['text'] = ""
+            messagebox.showerror("Error", f"Failed to load session: {str(e)}")
+            return
+
+        if loaded < reader.record_count:
+            loader[2] = loaded
+            self.status_label['text'] = f"Loading session... {loaded} of {reader.record_count}"
+            self.master.after(1, self._load_session_batch, loader)
+        else:
+            self.session_loader = None
+            reader.close()
+            self.status_label['text'] = ""
+
+    @staticmethod
+    def file_number(filename):
+        match = re.search(r'_(\d+)\.[^.]*$', filename)
+        return int(match.group(1)) if match else 0
+
+    def row_values(self, record):
+        return (record.filename, record.note)
+
+    def record_metadata(self, record):
+        # Oturuma kaydedilecek dosya meta verisi; alt sınıflar doldurabilir
+        return None
+
+    def restore_metadata(self, path, blob):
+        pass
+
+    def _insert_records(self, records):
+        # Kayıtlar sıralı konumlarına eklenir; Treeview'da yalnızca görünen pencere yenilenir
+        self.files.insert_sorted(records)
+        self.view.refresh()
+        return records
+
+    def refresh_row(self, record):
+        self.view.refresh_row(record)
         
     def create_buttons(self):
         raise NotImplementedError("Subclasses must implement create_buttons method")
 
+    def add_small_gif_option(self, column):
+        # Ortak paletli, yalnızca değişen bölgeleri yazan küçük GIF kipi
+        self.optimize_gif = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.button_frame, text="Small GIF",
+                        variable=self.optimize_gif).grid(column=column, row=0, padx=2, pady=2)
+
+    def show_gif_preview(self, frames):
+        # Kullanıcı kaydetmeyi seçerse True döner
+        try:
+            preview_window = GifPreviewWindow(self.master, frames=frames)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return False
+        self.master.wait_window(preview_window)
+
+        if not preview_window.result:
+            messagebox.showinfo("Cancelled", "GIF creation cancelled.")
+        return preview_window.result
+
     def bind_shortcuts(self):
         self.master.bind('<Control-z>', lambda event: self.undo_last_action())
 
-    @staticmethod
-    def natural_sort_key(s):
-        return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', s)]
+    natural_sort_key = staticmethod(jft_engine.natural_sort_key)
 
     def sort_items(self):
-        items = [(self.tree.set(k, 'Filename'), k) for k in self.tree.get_children('')]
-        items.sort(key=lambda x: self.natural_sort_key(x[0]))  # Her zaman artan sıralama
-        for index, (_, k) in enumerate(items):
-            self.tree.move(k, '', index)
-        
-        self.files.sort(key=lambda x: self.natural_sort_key(x[2]))  # Dahili listeyi de sırala
+        # Anahtarlar kayıtlarda saklıdır; sıralı listede sıralama doğrusaldır
+        self.files.sort()  # Her zaman artan sıralama
+        self.view.refresh()
+
     def drop(self, event):
         paths = self.tree.tk.splitlist(event.data)
         self.process_dropped_items(paths)
@@ -347,36 +1047,143 @@ class BaseConverter:
         return self.conflict_resolution
 
     def add_file(self, path):
-        # Bu metod alt sınıflarda override edilecek
+        # Bu metod alt sınıflarda override edilecek; eklenen FileRecord'u döndürür
         pass
 
+    def create_record(self, path):
+        # Bu metod alt sınıflarda override edilecek
+        raise NotImplementedError("Subclasses must implement create_record method")
+
+    def is_valid_file(self, path, stat=None):
+        return True
+
     def process_dropped_items(self, paths):
         self.conflict_resolution = None
         self.apply_to_all = False
-        
-        sorted_paths = sorted(paths, key=lambda p: self.natural_sort_key(os.path.basename(p)))
-        
-        added_items = []
-        for path in sorted_paths:
-            if os.path.isdir(path):
-                self.process_directory(path)
-            else:
-                item = self.add_file(path)
-                if item:
-                    added_items.append(item)
-        
-        if added_items:
-            self.undo_stack.append(('add', [file for file in self.files if file[0] in added_items]))
-        self.sort_items()
 
-    def process_directory(self, directory):
-        files = [os.path.join(directory, f) for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-        sorted_files = sorted(files, key=lambda p: self.natural_sort_key(os.path.basename(p)))
-        
-        for file_path in sorted_files:
-            self.add_file(file_path)
+        # Önceki bırakma bitmeden gelenler sıraya alınır
+        if self.ingest_job:
+            self.pending_drops.append(paths)
+            return
+
+        job = IngestJob(paths, self.process_directory, self.is_valid_file, self.natural_sort_key)
+        self.ingest_job = job
+        self.ingest_added = []
+        self.ingest_invalid = []
+        self.ingest_total = 0
+        self.cancel_button.grid()
+        self.update_progress(0, "Scanning files...")
+        job.start()
+        self.master.after(self.INGEST_POLL_MS, self._poll_ingest, job)
+
+    def process_directory(self, directory, cancel_event=None):
+        # Arka plan iş parçacığında çalışır; Tk'ye dokunmaz.
+        # Alt klasörler dahil, doğal sıralı ScanEntry listesi döndürür.
+        return jft_engine.scan_directory(directory, self.file_patterns, cancel_event=cancel_event)
+
+    def cancel_ingest(self, event=None):
+        if self.ingest_job:
+            self.ingest_job.cancel()
+            self.pending_drops.clear()
+
+    def cancel_work(self, event=None):
+        self.cancel_ingest()
+        if self.conversion_cancel is not None:
+            self.conversion_cancel.set()
+
+    def conversion_busy(self):
+        # Aynı anda tek dönüşüm çalışır; iki çalışma iptal düğmesini ve aynı
+        # çıktının .part dosyasını paylaşamaz
+        if self.conversion_cancel is None:
+            return False
+        messagebox.showinfo("Busy", "A conversion is already running. Wait for it to finish or cancel it.")
+        return True
+
+    def start_conversion(self, target, *args):
+        # İşçi son bağımsız değişken olarak iptal olayını alır; bitince
+        # progress_channel üzerinden end_conversion(olay) çağrılır.
+        # Önizleme gibi pencereler açıkken başka bir dönüşüm başlamış olabilir.
+        if self.conversion_busy():
+            return
+        self.conversion_cancel = threading.Event()
+        self.cancel_button.grid()
+        self.progress_channel.begin()
+        threading.Thread(target=target, args=args + (self.conversion_cancel,)).start()
+
+    def end_conversion(self, cancel_event):
+        if cancel_event is not self.conversion_cancel:
+            return
+        self.conversion_cancel = None
+        if not self.ingest_job:
+            self.cancel_button.grid_remove()
+
+    def _report_cancelled(self, save_path):
+        # Kısmi çıktı ve kontrol noktası kalır; aynı dosyaya yeniden dönüştürmek kaldığı yerden sürer
+        message = (f"Conversion cancelled. Convert to {os.path.basename(save_path)} again with the same "
+                   "files to resume where it stopped.")
+        self.progress_channel.call(lambda: messagebox.showinfo("Cancelled", message))
+
+    def _poll_ingest(self, job):
+        if job is not self.ingest_job or not self.frame.winfo_exists():
+            job.cancel()
+            return
+
+        finished = cancelled = False
+        added = 0
+        try:
+            # Tek turda en fazla birkaç parça işlenir; pencere tepkisini korur
+            while added < job.batch_size * 4:
+                message = job.queue.get_nowait()
+                if message[0] == 'total':
+                    self.ingest_total = message[1]
+                elif message[0] == 'batch':
+                    _, valid, invalid, done = message
+                    records = [self.create_record(path) for path in valid]
+                    self.files.insert_sorted(records)
+                    self.ingest_added.extend(records)
+                    self.ingest_invalid.extend(invalid)
+                    added += len(records)
+                    total = self.ingest_total or 1
+                    self.update_progress(done / total * 100,
+                                         f"Adding files... {done} of {self.ingest_total} (Esc to cancel)")
+                elif message[0] == 'error':
+                    messagebox.showerror("Error", f"An error occurred while adding files: {str(message[1])}")
+                elif message[0] == 'done':
+                    finished, cancelled = True, message[1]
+                    break
+        except queue.Empty:
+            pass
+
+        if added:
+            self.changes_made = True
+            self.view.refresh()
+
+        if not finished:
+            self.master.after(self.INGEST_POLL_MS, self._poll_ingest, job)
+            return
+
+        self.ingest_job = None
+        if self.conversion_cancel is None:
+            self.cancel_button.grid_remove()
+        self.update_progress(0, "Adding cancelled." if cancelled else "")
+        if self.ingest_added:
+            self.undo_stack.append(('add', self.ingest_added))
+        self.view.refresh()
+        if self.ingest_invalid:
+            self.report_invalid_files(self.ingest_invalid)
+        if self.pending_drops:
+            self.process_dropped_items(self.pending_drops.pop(0))
+
+    def report_invalid_files(self, paths):
+        shown = "\n".join(paths[:10])
+        more = f"\n...and {len(paths) - 10} more" if len(paths) > 10 else ""
+        messagebox.showwarning("Invalid Files",
+                               f"{len(paths)} file(s) are not supported and were skipped:\n{shown}{more}")
 
     def cleanup(self):
+        # Pencere kapanırken süren dönüşüm de durur; işçi .part dosyasını bırakır
+        if self.conversion_cancel is not None:
+            self.conversion_cancel.set()
         self.master.unbind_all('<Control-z>')
         self.master.protocol("WM_DELETE_WINDOW", self.master.on_closing)
         self.frame.destroy()
@@ -389,7 +1196,7 @@ class BaseConverter:
         self.master.show_main_menu()
 
     def remove_selected(self, event=None):
-        selected_items = self.tree.selection()
+        selected_items = self.view.selection()
         if not selected_items:
             return
 
@@ -399,34 +1206,24 @@ class BaseConverter:
             message = f"Are you sure you want to remove these {len(selected_items)} items?"
 
         if messagebox.askyesno("Confirm Removal", message):
-            removed_items = []
-            for item in selected_items:
-                values = self.tree.item(item, 'values')
-                file_info = next((file for file in self.files if file[0] == item), None)
-                if file_info:
-                    removed_items.append(file_info)
-                    self.tree.delete(item)
-                    self.files.remove(file_info)
-
-            if removed_items:
-                self.undo_stack.append(('remove', removed_items))
+            removed_records = self.files.remove_items(selected_items)
+            if removed_records:
+                self.view.select([])
+                self.view.refresh()
+                self.undo_stack.append(('remove', removed_records))
                 self.changes_made = True
-                self.tree.update()
 
     def on_click(self, event):
-        item = self.tree.identify('item', event.x, event.y)
-        if item:
-            self.tree.selection_set(item)
         self.hide_text_editor()
+        return self.view.click(event)
 
     def on_select(self, event):
         self.hide_text_editor()
 
     def open_file(self, item):
-        file_info = next((file for file in self.files if file[0] == item), None)
-        if file_info:
-            path = file_info[1]
-            self.safe_open_file(path)
+        record = self.files.get(item)
+        if record:
+            self.safe_open_file(record.path)
 
     @staticmethod
     def safe_open_file(path):
@@ -434,15 +1231,20 @@ class BaseConverter:
             if platform.system() == "Windows":
                 os.startfile(path)
             elif platform.system() == "Darwin":  # macOS
+                import subprocess
                 subprocess.call(["open", path])
             else:  # Linux and other systems
+                import subprocess
                 subprocess.call(["xdg-open", path])
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {str(e)}")
 
     def edit_note(self, item):
         self.hide_text_editor()
-        current_value = self.tree.set(item, 'Note')
+        record = self.files.get(item)
+        if not record:
+            return
+        current_value = record.note
         
         text_editor = tk.Text(self.tree, wrap=tk.WORD, height=3)
         text_editor.insert(tk.END, current_value)
@@ -450,9 +1252,9 @@ class BaseConverter:
         def save_note(event=None):
             new_value = text_editor.get("1.0", tk.END).strip()
             if new_value != current_value:
-                self.tree.set(item, 'Note', new_value)
                 self.update_note_in_files(item, new_value)
-                self.undo_stack.append(('edit_note', (item, current_value)))
+                self.refresh_row(record)
+                self.undo_stack.append(('edit_note', (record, current_value)))
                 self.changes_made = True
             self.hide_text_editor()
 
@@ -467,10 +1269,9 @@ class BaseConverter:
         text_editor.focus_set()
 
     def update_note_in_files(self, item, new_value):
-        for i, file_info in enumerate(self.files):
-            if file_info[0] == item:
-                self.files[i] = (*file_info[:-1], new_value)
-                break
+        record = self.files.get(item)
+        if record:
+            record.note = new_value
 
     def hide_text_editor(self):
         for editor in self.text_editors.values():
@@ -492,19 +1293,19 @@ class BaseConverter:
         if new_base_name:
             old_names = []
             # Dosya adlarından sayıları çıkar ve sırala
-            numbered_files = sorted([(int(''.join(filter(str.isdigit, os.path.splitext(file[2])[0]))), file) for file in self.files])
+            numbered_files = sorted(self.files, key=lambda record: int(''.join(filter(str.isdigit, os.path.splitext(record.filename)[0]))))
             
-            for index, (_, file) in enumerate(numbered_files, start=1):
-                item, old_path, old_filename, *rest = file
-                old_names.append((item, old_filename))
+            for index, record in enumerate(numbered_files, start=1):
+                old_path, old_filename = record.path, record.filename
+                old_names.append((record, old_filename))
                 extension = os.path.splitext(old_filename)[1]
                 new_name = f"{new_base_name}_{index}{extension}"
                 new_path = os.path.join(os.path.dirname(old_path), new_name)
 
                 try:
                     os.rename(old_path, new_path)
-                    self.tree.item(item, values=(new_name, *rest))
-                    self.files[self.files.index(file)] = (item, new_path, new_name, *rest)
+                    record.path, record.filename = new_path, new_name
+                    self.refresh_row(record)
                 except OSError as e:
                     messagebox.showerror("Error", f"Failed to rename {old_path}: {str(e)}")
 
@@ -515,7 +1316,7 @@ class BaseConverter:
             
     def get_next_filename(self, filename):
         base, ext = os.path.splitext(filename)
-        existing_files = [file[2] for file in self.files]
+        existing_files = [record.filename for record in self.files]
         
         if not existing_files:
             return f"{base}_1{ext}"
@@ -564,75 +1365,45 @@ class BaseConverter:
         
         try:
             if action == 'remove':
-                for item, path, filename, *rest in items:
-                    new_item = self.tree.insert('', 'end', values=(filename, *rest))
-                    self.files.append((new_item, path, filename, *rest))
+                self._insert_records(items)
             elif action == 'add':
-                for item, _, _, *_ in items:
-                    if self.tree.exists(item):
-                        self.tree.delete(item)
-                        self.files = [file for file in self.files if file[0] != item]
+                self.files.remove_items([record.item for record in items])
             elif action == 'rename_all':
-                for item, old_name in items:
-                    if self.tree.exists(item):
-                        current_values = self.tree.item(item, 'values')
-                        file_info = next((file for file in self.files if file[0] == item), None)
-                        if file_info:
-                            new_path = os.path.join(os.path.dirname(file_info[1]), old_name)
-                            try:
-                                os.rename(file_info[1], new_path)
-                                self.tree.item(item, values=(old_name, *current_values[1:]))
-                                index = self.files.index(file_info)
-                                self.files[index] = (item, new_path, old_name, *file_info[3:])
-                            except OSError as e:
-                                messagebox.showerror("Error", f"Failed to rename file: {str(e)}")
+                for record, old_name in items:
+                    if record.item in self.files:
+                        new_path = os.path.join(os.path.dirname(record.path), old_name)
+                        try:
+                            os.rename(record.path, new_path)
+                            record.path, record.filename = new_path, old_name
+                            self.refresh_row(record)
+                        except OSError as e:
+                            messagebox.showerror("Error", f"Failed to rename file: {str(e)}")
+                # Yalnızca adlar değiştiğinde yeniden sıralamak gerekir
+                self.sort_items()
             elif action == 'edit_note':
-                item, old_value = items
-                if self.tree.exists(item):
-                    current_values = self.tree.item(item, 'values')
-                    self.tree.item(item, values=(*current_values[:-1], old_value))
-                    file_info = next((file for file in self.files if file[0] == item), None)
-                    if file_info:
-                        index = self.files.index(file_info)
-                        self.files[index] = (*file_info[:-1], old_value)
-            elif action == 'edit_repeat':
-                item, old_value = items
-                if self.tree.exists(item):
-                    current_values = self.tree.item(item, 'values')
-                    self.tree.item(item, values=(current_values[0], old_value, *current_values[2:]))
-                    file_info = next((file for file in self.files if file[0] == item), None)
-                    if file_info:
-                        index = self.files.index(file_info)
-                        self.files[index] = (*file_info[:3], old_value, *file_info[4:])
-            elif action == 'set_all_repeats':
-                for item, old_value in items:
-                    if self.tree.exists(item):
-                        self.tree.set(item, 'Repeat', old_value)
-                        file_info = next((file for file in self.files if file[0] == item), None)
-                        if file_info:
-                            index = self.files.index(file_info)
-                            self.files[index] = (*file_info[:3], old_value, *file_info[4:])
-            
-            self.sort_items()
+                record, old_value = items
+                if record.item in self.files:
+                    record.note = old_value
+                    self.refresh_row(record)
+            elif action in ('edit_repeat', 'set_all_repeats'):
+                for record, old_value in ([items] if action == 'edit_repeat' else items):
+                    if record.item in self.files:
+                        record.repeat = old_value
+                        self.refresh_row(record)
+
             self.changes_made = True
         except Exception as e:
             messagebox.showerror("Undo Error", f"An error occurred during undo: {str(e)}")
             print(f"Undo error: {str(e)}")
         finally:
-            self.tree.update()
+            self.view.refresh()
 
     def tree_exists(self, item):
-        try:
-            self.tree.item(item)
-            return True
-        except tk.TclError:
-            return False
+        return item in self.files
 
     def find_insert_index(self, filename):
-        for index, child in enumerate(self.tree.get_children()):
-            if self.natural_sort_key(filename) < self.natural_sort_key(self.tree.item(child)['values'][0]):
-                return index
-        return 'end'
+        index = self.files.bisect(filename)
+        return index if index < len(self.files) else 'end'
 
     def on_closing(self):
         if self.changes_made:
@@ -671,6 +1442,8 @@ class BaseConverter:
         self.master.update_idletasks()
 
 class ImageConverter(BaseConverter):
+    file_patterns = jft_engine.IMAGE_PATTERNS
+
     def __init__(self, master):
         super().__init__(master)
         self.tree.configure(columns=('Filename', 'Repeat', 'Note'))
@@ -680,8 +1453,13 @@ class ImageConverter(BaseConverter):
         self.tree.column('Filename', width=300)
         self.tree.column('Repeat', width=100)
         self.tree.column('Note', width=200)
+        self.create_thumbnail_column()
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.frame_counter = {}  # Her benzersiz görüntü için sayaç
+        self.encoded_frames = jft_engine.EncodedFrameCache()  # (path, mtime, size, seçenekler) -> base64 data URL
+        self.encode_workers = None  # None: işlemci çekirdeği sayısı kadar süreç
+        self.encode_queue_size = None  # None: işçi sayısının iki katı
+        self.image_info = jft_engine.ImageInfoCache()  # path -> (boyut, mtime) ile doğrulama sonucu
+        self.export_options = jft_engine.ExportOptions()
         self.tree.bind('<Double-1>', self.on_double_click)
 
     def create_buttons(self):
@@ -690,6 +1468,7 @@ class ImageConverter(BaseConverter):
             ("Remove", self.remove_selected),
             ("Set Repeats", self.set_all_repeats),
             ("JSON", self.convert_to_json),
+            ("Options", self.edit_export_options),
             ("GIF", self.convert_to_gif),
             ("Reverse", self.reverse_order),
             ("Rename All", self.rename_all),
@@ -703,25 +1482,41 @@ class ImageConverter(BaseConverter):
             self.button_frame.grid_columnconfigure(i, weight=1)
             ttk.Button(self.button_frame, text=text, command=command).grid(column=i, row=0, sticky=(tk.W, tk.E), padx=2, pady=2)
 
+        self.add_small_gif_option(len(buttons))
+
     def load_session_dialog(self):
         filename = filedialog.askopenfilename(filetypes=[("JFT files", "*.jft")])
         if filename:
             self.load_session(filename)
 
+    def create_thumbnail_column(self):
+        # Küçük resimler ağaç sütununda gösterilir; yalnızca görünen satırlar için yüklenir
+        cache = jft_engine.ThumbnailCache()
+        width, height = cache.size
+        ttk.Style(self.master).configure('Thumbnails.Treeview', rowheight=height + 4)
+        self.tree.configure(style='Thumbnails.Treeview', show=('tree', 'headings'))
+        self.tree.heading('#0', text='')
+        self.tree.column('#0', width=width + 12, stretch=False)
+        self.thumbnails = ThumbnailLoader(self.tree, cache, self.view.refresh)
+        self.view.row_image = lambda record: self.thumbnails.image(record.path)
+        self.view.refresh()
+
+    def row_values(self, record):
+        return (record.filename, record.repeat, record.note)
+
+    def create_record(self, path):
+        self.file_counter += 1
+        original_filename = os.path.basename(path)
+        new_filename = f"work_{self.file_counter}{os.path.splitext(original_filename)[1]}"
+        return FileRecord(None, path, new_filename, 1, '')
+
     def add_file(self, path):
         if self.is_valid_image(path):
-            self.file_counter += 1
-            original_filename = os.path.basename(path)
-            new_filename = f"work_{self.file_counter}{os.path.splitext(original_filename)[1]}"
-            
             # Yeni bir giriş oluştur
-            item = self.tree.insert('', 'end', values=(new_filename, '1', ''))
-            self.files.append((item, path, new_filename, 1, ''))
-            self.undo_stack.append(('add', [(item, path, new_filename, 1, '')]))
+            record = self.create_record(path)
+            self.files.insert_sorted([record])
             self.changes_made = True
-            
-            self.tree.update()
-            return item
+            return record
         else:
             messagebox.showwarning("Invalid Image", f"The file {path} is not a valid image and will be skipped.")
             return None
@@ -730,28 +1525,29 @@ class ImageConverter(BaseConverter):
         name, ext = os.path.splitext(filename)
         counter = 1
         new_filename = f"{name}_{counter}{ext}"
-        while any(file[2] == new_filename for file in self.files):
+        while any(record.filename == new_filename for record in self.files):
             counter += 1
             new_filename = f"{name}_{counter}{ext}"
         return new_filename
     
-    def is_valid_file(self, path):
-        return self.is_valid_image(path)
+    def is_valid_file(self, path, stat=None):
+        return self.is_valid_image(path, stat)
 
-    @staticmethod
-    def is_valid_image(path):
-        try:
-            with Image.open(path) as img:
-                img.verify()
-            return True
-        except Exception:
-            return False
+    def is_valid_image(self, path, stat=None):
+        # Değişmemiş dosyalar için yalnızca stat; yeni dosyalarda önce başlık okunur
+        return self.image_info.get(path, stat).valid
+
+    def record_metadata(self, record):
+        return self.image_info.export(record.path)
+
+    def restore_metadata(self, path, blob):
+        self.image_info.restore(path, blob)
 
     def on_double_click(self, event):
         item = self.tree.identify('item', event.x, event.y)
         if item:
             column = self.tree.identify_column(event.x)
-            if column == '#1':  # Filename column
+            if column in ('#0', '#1'):  # Thumbnail and Filename columns
                 self.open_file(item)
             elif column == '#2':  # Repeat Count column
                 self.edit_repeat_count(item)
@@ -760,17 +1556,14 @@ class ImageConverter(BaseConverter):
 
     def add_images(self):
         file_paths = filedialog.askopenfilenames(filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp")])
-        added_items = []
-        for path in file_paths:
-            item = self.add_file(path)
-            if item:
-                added_items.append(item)
-        if added_items:
-            self.undo_stack.append(('add', added_items))
-        self.sort_items()
+        if file_paths:
+            self.process_dropped_items(file_paths)
 
     def edit_repeat_count(self, item):
-        current_value = int(self.tree.set(item, 'Repeat'))
+        record = self.files.get(item)
+        if not record:
+            return
+        current_value = int(record.repeat)
         dialog = CustomIntegerDialog(self.master, "Edit Repeat Count", 
                                      "Enter new repeat count:", 
                                      initial_value=current_value, 
@@ -778,12 +1571,9 @@ class ImageConverter(BaseConverter):
         self.master.wait_window(dialog)
         new_value = dialog.result
         if new_value is not None and new_value != current_value:
-            self.tree.set(item, 'Repeat', new_value)
-            for i, (tree_item, path, filename, _, note) in enumerate(self.files):
-                if tree_item == item:
-                    self.files[i] = (tree_item, path, filename, new_value, note)
-                    self.undo_stack.append(('edit_repeat', (item, current_value)))
-                    break
+            record.repeat = new_value
+            self.refresh_row(record)
+            self.undo_stack.append(('edit_repeat', (record, current_value)))
             self.changes_made = True
 
     def set_all_repeats(self):
@@ -794,10 +1584,10 @@ class ImageConverter(BaseConverter):
                 repeat_value = int(dialog.result)
                 if 1 <= repeat_value <= 1000:
                     old_values = []
-                    for item in self.tree.get_children():
-                        old_values.append((item, self.tree.set(item, 'Repeat')))
-                        self.tree.set(item, 'Repeat', repeat_value)
-                    self.files = [(item, path, filename, repeat_value, note) for item, path, filename, _, note in self.files]
+                    for record in self.files:
+                        old_values.append((record, record.repeat))
+                        record.repeat = repeat_value
+                        self.refresh_row(record)
                     self.undo_stack.append(('set_all_repeats', old_values))
                     self.changes_made = True
                 else:
@@ -806,6 +1596,8 @@ class ImageConverter(BaseConverter):
                 tk.messagebox.showerror("Invalid Input", "Please enter a valid integer between 1 and 1000.")
 
     def convert_to_json(self):
+        if self.conversion_busy():
+            return
         if not self.files:
             messagebox.showerror("Error", "Please add images first.")
             return
@@ -814,68 +1606,56 @@ class ImageConverter(BaseConverter):
         if not save_path:
             return
 
-        threading.Thread(target=self._process_images_to_json, args=(save_path,)).start()
+        # Liste Tk iş parçacığında kopyalanır; işçi self.files'a dokunmaz
+        frames = [(record.path, record.repeat) for record in self.files]
+        names = [os.path.splitext(record.filename)[0] for record in self.files]
+        self.start_conversion(self._process_images_to_json, save_path, frames, names, self.export_options)
+
+    def edit_export_options(self):
+        dialog = ExportOptionsDialog(self.master, self.export_options)
+        self.master.wait_window(dialog)
+        if dialog.result:
+            self.export_options = dialog.result
 
-    def _process_images_to_json(self, save_path):
+    def _process_images_to_json(self, save_path, frames, names, options, cancel_event=None):
         try:
-            total_images = sum(repeat for _, _, _, repeat, _ in self.files)
-            processed_images = 0
-            self.frame_counter.clear()
-
-            self.update_progress(0, "Starting conversion to JSON...")
-
-            with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_file:
-                temp_file.write('[')
-                first_item = True
-                for _, path, filename, repeat, _ in self.files:
-                    base_name = os.path.splitext(filename)[0]
-                    if base_name not in self.frame_counter:
-                        self.frame_counter[base_name] = 0
-                    
-                    for i in range(repeat):
-                        self.frame_counter[base_name] += 1
-                        image_json = self._image_to_json(path, base_name, self.frame_counter[base_name])
-                        if image_json:
-                            if not first_item:
-                                temp_file.write(',')
-                            json.dump(image_json, temp_file)
-                            first_item = False
-                            processed_images += 1
-                            self.update_progress((processed_images / total_images) * 100,
-                                                 f"Processing image {processed_images} of {total_images}")
-                temp_file.write(']')
-
-            self.update_progress(100, "Saving JSON file...")
-
-            os.replace(temp_file.name, save_path)
-            
-            self.update_progress(100, "Conversion complete!")
-            self.master.after(0, lambda: messagebox.showinfo("Success", f"JSON file saved as {save_path}"))
+            total_images = sum(repeat for _, repeat in frames)
+
+            channel = self.progress_channel
+            channel.start(total_images, "Starting conversion to JSON...", "Processing image {done} of {total}")
+
+            # Eski girişleri at; kalan girişler mtime/size ile doğrulanıyor
+            current_paths = {path for path, _ in frames}
+            options_key = options.key()
+            for key in [key for key in self.encoded_frames
+                        if key[0] not in current_paths or key[3] != options_key]:
+                del self.encoded_frames[key]
+
+            stats = jft_engine.images_to_json(frames, save_path, names=names,
+                                              workers=self.encode_workers, queue_size=self.encode_queue_size,
+                                              cache=self.encoded_frames, options=options,
+                                              progress=channel.advance, on_error=self._report_image_error,
+                                              cancel_event=cancel_event, resume=True)
+
+            channel.status("Conversion complete!")
+            channel.call(lambda: messagebox.showinfo("Success",
+                                                     f"JSON file saved as {save_path}\n{stats.summary()}"))
+        except jft_engine.ConversionCancelled:
+            self._report_cancelled(save_path)
         except Exception as e:
-            self.master.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {str(e)}"))
+            message = f"An error occurred: {str(e)}"
+            self.progress_channel.call(lambda: messagebox.showerror("Error", message))
         finally:
-            self.update_progress(0, "")
+            self.progress_channel.call(lambda: self.end_conversion(cancel_event))
+            self.progress_channel.finish()
 
-    def _image_to_json(self, image_path, base_name, frame_number):
-        try:
-            with Image.open(image_path) as img:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                buffered = io.BytesIO()
-                img.save(buffered, format="PNG")
-                img_str = base64.b64encode(buffered.getvalue()).decode()
-
-            return {
-                "name": f"Frame_{base_name}_{frame_number}",
-                "timestamp": int(datetime.datetime.now().timestamp() * 1000),
-                "soft": False,
-                "image_data": f"data:image/png;base64,{img_str}"
-            }
-        except Exception as e:
-            self.master.after(0, lambda: messagebox.showwarning("Image Processing Error", f"Error processing {image_path}: {str(e)}"))
-            return None
+    def _report_image_error(self, image_path, error):
+        message = f"Error processing {image_path}: {str(error)}"
+        self.progress_channel.call(lambda: messagebox.showwarning("Image Processing Error", message))
 
     def convert_to_gif(self):
+        if self.conversion_busy():
+            return
         if not self.files:
             messagebox.showerror("Error", "Please add images first.")
             return
@@ -885,86 +1665,49 @@ class ImageConverter(BaseConverter):
         if not duration:
             return
 
-        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as temp_file:
-            temp_path = temp_file.name
+        # Önizleme kaynak dosyalardan küçültülerek oynatılır; GIF yalnızca kaydederken kodlanır
+        frames = [(record.path, record.repeat) for record in self.files]
+        if not self.show_gif_preview(lambda: jft_engine.iter_image_frames(frames, duration)):
+            return
+        save_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=[("GIF files", "*.gif")])
+        if not save_path:
+            return
 
-        threading.Thread(target=self._process_images_to_gif, args=(temp_path, duration)).start()
+        self.start_conversion(self._process_images_to_gif, save_path, frames, duration, self.optimize_gif.get())
 
-    def _process_images_to_gif(self, save_path, duration):
+    def _process_images_to_gif(self, save_path, frames, duration, optimize=False, cancel_event=None):
         try:
-            frames = []
-            total_steps = sum(repeat for _, _, _, repeat, _ in self.files) + 1  # +1 for saving
-            current_step = 0
-
-            self.update_progress(0, "Starting conversion to GIF...")
-
-            for _, path, _, repeat, _ in self.files:
-                try:
-                    with Image.open(path) as img:
-                        if img.mode != 'RGB':
-                            img = img.convert('RGB')
-                        for _ in range(repeat):
-                            frames.append(img.copy())
-                            current_step += 1
-                            self.update_progress((current_step / total_steps) * 100,
-                                                 f"Processing frame {current_step} of {total_steps - 1}")
-                except Exception as e:
-                    self.master.after(0, lambda: messagebox.showwarning("Image Processing Error", f"Error processing {path}: {str(e)}"))
-
-            if not frames:
-                self.master.after(0, lambda: messagebox.showerror("Error", "No valid images to convert to GIF."))
-                return
+            total_steps = sum(repeat for _, repeat in frames)
 
-            self.update_progress(100, "Saving GIF...")
+            channel = self.progress_channel
+            channel.start(total_steps, "Starting conversion to GIF...", "Processing frame {done} of {total}")
 
-            frames[0].save(
-                save_path,
-                save_all=True,
-                append_images=frames[1:],
-                duration=duration,
-                loop=0,
-                optimize=False
-            )
+            # Kareler diske akıtılır; bellekte aynı anda yalnızca bir kare bulunur
+            frame_count = jft_engine.images_to_gif(frames, save_path, duration, optimize=optimize,
+                                                   progress=channel.advance,
+                                                   on_error=self._report_image_error,
+                                                   cancel_event=cancel_event, resume=True)
 
-            self.update_progress(100, "Conversion complete! Opening preview...")
+            if not frame_count:
+                self.safe_remove(save_path)
+                channel.call(lambda: messagebox.showerror("Error", "No valid images to convert to GIF."))
+                return
 
-            self.master.after(0, lambda: self.show_gif_preview(save_path))
+            channel.status("Conversion complete!")
+            channel.call(lambda: messagebox.showinfo("Success", f"GIF saved as {save_path}"))
+        except jft_engine.ConversionCancelled:
+            self._report_cancelled(save_path)
         except Exception as e:
-            self.master.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {str(e)}"))
+            message = f"An error occurred: {str(e)}"
+            self.progress_channel.call(lambda: messagebox.showerror("Error", message))
         finally:
-            self.update_progress(0, "")
+            self.progress_channel.call(lambda: self.end_conversion(cancel_event))
+            self.progress_channel.finish()
 
-    def show_gif_preview(self, temp_path):
-        try:
-            preview_window = GifPreviewWindow(self.master, temp_path)
-            self.master.wait_window(preview_window)
-
-            if preview_window.result:
-                final_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=[("GIF files", "*.gif")])
-                if final_path:
-                    try:
-                        shutil.move(temp_path, final_path)
-                        messagebox.showinfo("Success", f"GIF saved as {final_path}")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to save GIF: {str(e)}")
-                        # Eğer taşıma başarısız olursa, temp_path'i silmeyi dene
-                        self.safe_remove(temp_path)
-                else:
-                    # Kullanıcı kaydetmeyi iptal ettiyse temp_path'i sil
-                    self.safe_remove(temp_path)
-            else:
-                messagebox.showinfo("Cancelled", "GIF creation cancelled.")
-                # Kullanıcı önizlemeyi kapattıysa temp_path'i sil
-                self.safe_remove(temp_path)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.safe_remove(temp_path)
-        finally:
-            # Son bir kontrol daha yap
-            if os.path.exists(temp_path):
-                self.safe_remove(temp_path)
 
 class JsonToGifConverter(BaseConverter):
+    file_patterns = jft_engine.JSON_PATTERNS
+
     def __init__(self, master):
         super().__init__(master)
         self.tree.configure(columns=('Filename', 'Note'))
@@ -973,6 +1716,7 @@ class JsonToGifConverter(BaseConverter):
         self.tree.column('Filename', width=400)
         self.tree.column('Note', width=200)
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.fast_merge = True  # Birleştirmede öğeleri çözmeden bayt düzeyinde kopyala
         
         self.tree.bind('<Double-1>', self.on_double_click)
 
@@ -994,6 +1738,8 @@ class JsonToGifConverter(BaseConverter):
             self.button_frame.grid_columnconfigure(i, weight=1)
             ttk.Button(self.button_frame, text=text, command=command).grid(column=i, row=0, sticky=(tk.W, tk.E), padx=2, pady=2)
 
+        self.add_small_gif_option(len(buttons))
+
     def on_double_click(self, event):
         item = self.tree.identify('item', event.x, event.y)
         if item:
@@ -1008,37 +1754,31 @@ class JsonToGifConverter(BaseConverter):
         if filename:
             self.load_session(filename)
 
+    def create_record(self, path):
+        self.file_counter += 1
+        new_filename = f"work_{self.file_counter}.json"
+        return FileRecord(None, path, new_filename, 1, '')
+
     def add_file(self, path):
-        if path.lower().endswith('.json'):
-            self.file_counter += 1
-            original_filename = os.path.basename(path)
-            new_filename = f"work_{self.file_counter}.json"
-            
+        if self.is_valid_file(path):
             # Yeni bir giriş oluştur
-            item = self.tree.insert('', 'end', values=(new_filename, ''))
-            self.files.append((item, path, new_filename, ''))
-            self.undo_stack.append(('add', [(item, path, new_filename, '')]))
+            record = self.create_record(path)
+            self.files.insert_sorted([record])
             self.changes_made = True
-            
-            self.tree.update()
-            return item
+            return record
         else:
             messagebox.showwarning("Invalid File", f"The file {path} is not a JSON file and will be skipped.")
             return None
 
     def add_json_files(self):
         file_paths = filedialog.askopenfilenames(filetypes=[("JSON files", "*.json")])
-        added_items = []
-        for path in file_paths:
-            item = self.add_file(path)
-            if item:
-                added_items.append(item)
-        if added_items:
-            self.undo_stack.append(('add', added_items))
-        self.sort_items()
+        if file_paths:
+            self.process_dropped_items(file_paths)
 
 
     def merge_json_files(self):
+        if self.conversion_busy():
+            return
         if not self.files:
             messagebox.showerror("Error", "No JSON files to merge.")
             return
@@ -1047,56 +1787,39 @@ class JsonToGifConverter(BaseConverter):
         if not save_path:
             return
 
-        threading.Thread(target=self._process_json_files, args=(save_path,)).start()
+        paths = [record.path for record in self.files]
+        self.start_conversion(self._process_json_files, save_path, paths)
 
 
-    def is_valid_file(self, path):
+    def is_valid_file(self, path, stat=None):
         return path.lower().endswith('.json')
     
-    def _process_json_files(self, save_path):
+    def _process_json_files(self, save_path, paths, cancel_event=None):
         try:
-            total_files = len(self.files)
-            processed_files = 0
-
-            self.update_progress(0, "Starting JSON merge...")
-
-            with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_file:
-                temp_file.write('[')
-                first_item = True
-                for _, path, _, _ in self.files:
-                    try:
-                        with open(path, 'r') as f:
-                            json_data = json.load(f)
-                        if isinstance(json_data, dict) and 'data' in json_data:
-                            json_data = json_data['data']
-                        elif not isinstance(json_data, list):
-                            json_data = [json_data]
-                        
-                        for item in json_data:
-                            if not first_item:
-                                temp_file.write(',')
-                            json.dump(item, temp_file)
-                            first_item = False
-                    except Exception as e:
-                        self.master.after(0, lambda: messagebox.showwarning("JSON Processing Error", f"Error processing {path}: {str(e)}"))
-                    
-                    processed_files += 1
-                    self.update_progress((processed_files / total_files) * 100,
-                                         f"Processing file {processed_files} of {total_files}")
-                temp_file.write(']')
-
-            self.update_progress(100, "Saving merged JSON file...")
-
-            os.replace(temp_file.name, save_path)
-            
-            self.update_progress(100, "Merge complete!")
-            self.master.after(0, lambda: messagebox.showinfo("Success", f"Merged JSON file saved as {save_path}"))
+            channel = self.progress_channel
+            channel.start(len(paths), "Starting JSON merge...", "Processing file {done} of {total}")
+
+            jft_engine.merge_json(paths, save_path, fast=self.fast_merge, progress=channel.advance,
+                                  on_error=self._report_json_error, cancel_event=cancel_event, resume=True)
+
+            channel.status("Merge complete!")
+            channel.call(lambda: messagebox.showinfo("Success", f"Merged JSON file saved as {save_path}"))
+        except jft_engine.ConversionCancelled:
+            self._report_cancelled(save_path)
         except Exception as e:
-            self.master.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {str(e)}"))
+            message = f"An error occurred: {str(e)}"
+            self.progress_channel.call(lambda: messagebox.showerror("Error", message))
         finally:
-            self.update_progress(0, "")
+            self.progress_channel.call(lambda: self.end_conversion(cancel_event))
+            self.progress_channel.finish()
+
+    def _report_json_error(self, path, error):
+        message = f"Error processing {path}: {str(error)}"
+        self.progress_channel.call(lambda: messagebox.showwarning("JSON Processing Error", message))
 
     def convert_to_gif(self):
+        if self.conversion_busy():
+            return
         if not self.files:
             messagebox.showerror("Error", "Please add JSON files first.")
             return
@@ -1106,85 +1829,44 @@ class JsonToGifConverter(BaseConverter):
         if not duration:
             return
 
-        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as temp_file:
-            temp_path = temp_file.name
+        # Önizleme JSON karelerinden doğrudan oynatılır; GIF yalnızca kaydederken kodlanır
+        paths = [record.path for record in self.files]
+        if not self.show_gif_preview(lambda: jft_engine.iter_json_frames(paths, duration)):
+            return
+        save_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=[("GIF files", "*.gif")])
+        if not save_path:
+            return
 
-        threading.Thread(target=self._process_json_files_to_gif, args=(temp_path, duration)).start()
+        self.start_conversion(self._process_json_files_to_gif, save_path, paths, duration, self.optimize_gif.get())
 
 
-    def _process_json_files_to_gif(self, save_path, duration):
+    def _process_json_files_to_gif(self, save_path, paths, duration, optimize=False, cancel_event=None):
         try:
-            frames = []
-            total_files = len(self.files)
-            processed_files = 0
-
-            self.update_progress(0, "Starting conversion to GIF...")
-
-            for _, path, _, _ in self.files:
-                try:
-                    with open(path, 'r') as f:
-                        json_data = json.load(f)
-                    
-                    if isinstance(json_data, dict) and 'data' in json_data:
-                        json_data = json_data['data']
-                    elif not isinstance(json_data, list):
-                        json_data = [json_data]
-                    
-                    for item in json_data:
-                        image_data = item.get('image_data', '')
-                        if image_data.startswith('data:image/'):
-                            _, base64_data = image_data.split(',', 1)
-                            image_bytes = base64.b64decode(base64_data)
-                            img = Image.open(io.BytesIO(image_bytes))
-                            frames.append(img.convert('RGBA'))
-                
-                except Exception as e:
-                    self.master.after(0, lambda: messagebox.showwarning("JSON Processing Error", f"Error processing {path}: {str(e)}"))
-                
-                processed_files += 1
-                self.update_progress((processed_files / total_files) * 100,
-                                     f"Processing file {processed_files} of {total_files}")
-
-            if not frames:
-                self.master.after(0, lambda: messagebox.showerror("Error", "No valid images found in JSON files."))
+            channel = self.progress_channel
+            channel.start(len(paths), "Starting conversion to GIF...", "Processing file {done} of {total}")
+
+            # Kareler tek tek çözülüp yazılır; bir dosyanın tamamı belleğe alınmaz
+            frame_count = jft_engine.json_to_gif(paths, save_path, duration, optimize=optimize,
+                                                 progress=channel.advance,
+                                                 on_error=self._report_json_error,
+                                                 cancel_event=cancel_event, resume=True)
+
+            if not frame_count:
+                self.safe_remove(save_path)
+                channel.call(lambda: messagebox.showerror("Error", "No valid images found in JSON files."))
                 return
 
-            self.update_progress(100, "Saving GIF...")
-
-            frames[0].save(
-                save_path,
-                save_all=True,
-                append_images=frames[1:],
-                duration=duration,
-                loop=0,
-                optimize=False
-            )
-
-            self.update_progress(100, "Conversion complete! Opening preview...")
-
-            self.master.after(0, lambda: self.show_gif_preview(save_path))
+            channel.status("Conversion complete!")
+            channel.call(lambda: messagebox.showinfo("Success", f"GIF saved as {save_path}"))
+        except jft_engine.ConversionCancelled:
+            self._report_cancelled(save_path)
         except Exception as e:
-            self.master.after(0, lambda: messagebox.showerror("Error", f"An error occurred: {str(e)}"))
+            message = f"An error occurred: {str(e)}"
+            self.progress_channel.call(lambda: messagebox.showerror("Error", message))
         finally:
-            self.update_progress(0, "")
+            self.progress_channel.call(lambda: self.end_conversion(cancel_event))
+            self.progress_channel.finish()
     
-    def show_gif_preview(self, temp_path):
-        preview_window = GifPreviewWindow(self.master, temp_path)
-        self.master.wait_window(preview_window)
-
-        if preview_window.result:
-            final_path = filedialog.asksaveasfilename(defaultextension=".gif", filetypes=[("GIF files", "*.gif")])
-            if final_path:
-                try:
-                    os.replace(temp_path, final_path)
-                    messagebox.showinfo("Success", f"GIF saved as {final_path}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to save GIF: {str(e)}")
-                    self.safe_remove(temp_path)
-            else:
-                self.safe_remove(temp_path)
-        else:
-            self.safe_remove(temp_path)
 
 class TipsViewer(BaseConverter):
     def __init__(self, master):
@@ -1336,5 +2018,9 @@ class Application(TkinterDnD.Tk):
             self.destroy()
         
 if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Yalnızca paketlenmiş sürümde gerekir
+        import multiprocessing
+        multiprocessing.freeze_support()
     app = Application()
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,226 @@
+import argparse
+import fnmatch
+import glob
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import jft_engine
+
+# JFT dönüşümlerinin arayüzsüz komut satırı sürümü. tkinter içe aktarılmaz;
+# render çiftliğinde gözetimsiz çalıştırılabilir.
+#
+#   python jft_cli.py images-to-gif "shots/**/*.png" -o out.gif -d 80 -r 2 -r "hold_*=10"
+#   python jft_cli.py merge-json a.json b.json -o merged.json
+#   python jft_cli.py batch jobs.json -j 8
+#
+# --resume ile ilerleme OUTPUT.part yanında düzenli olarak kaydedilir;
+# yarıda kalan (Ctrl-C, çökme) bir dönüşüm aynı komutla sürdürülür.
+#
+# Toplu iş dosyası bir iş listesidir (veya {"jobs": [...]}); her iş komut
+# satırı seçenekleriyle aynı alanları taşır. İşler birbirinden bağımsız
+# olmalıdır, çünkü aynı anda çalışırlar:
+#   {"command": "images-to-json", "inputs": ["shot1/*.png"], "output": "shot1.json",
+#    "repeat": ["2", "hold_*=10"], "duration": 100}
+
+COMMANDS = ('images-to-json', 'images-to-gif', 'json-to-gif', 'merge-json')
+
+
+def expand_inputs(inputs, patterns):
+    # Klasörler özyinelemeli taranır, glob desenleri genişletilir; her girdinin
+    # sonuçları doğal sırayla, girdiler ise verildiği sırayla eklenir.
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(entry.path for entry in jft_engine.scan_directory(item, patterns))
+        elif glob.has_magic(item):
+            matches = [path for path in glob.glob(item, recursive=True) if os.path.isfile(path)]
+            paths.extend(sorted(matches, key=lambda path: [jft_engine.natural_sort_key(part)
+                                                           for part in os.path.normpath(path).split(os.sep)]))
+        else:
+            paths.append(item)
+    return paths
+
+
+def parse_repeat_specs(specs):
+    # "3" tüm dosyalar için varsayılanı, "desen=3" ise dosya adı desene uyan
+    # dosyaları belirler. Birden çok desen eşleşirse sonuncusu geçerlidir.
+    default = 1
+    rules = []
+    for spec in specs or ():
+        spec = str(spec)
+        pattern, sep, count = spec.rpartition('=')
+        try:
+            count = int(count)
+        except ValueError:
+            raise ValueError(f"Invalid repeat spec: {spec}")
+        if count < 1:
+            raise ValueError(f"Repeat count must be at least 1: {spec}")
+        if sep:
+            rules.append((pattern, count))
+        else:
+            default = count
+
+    def repeat_for(path):
+        name = os.path.basename(path)
+        repeat = default
+        for pattern, count in rules:
+            if fnmatch.fnmatch(name, pattern):
+                repeat = count
+        return repeat
+    return repeat_for
+
+
+def export_options(job):
+    return jft_engine.ExportOptions(job.get('format', 'png'), int(job.get('compress_level', 6)),
+                                    bool(job.get('optimize', False)), bool(job.get('passthrough', False)),
+                                    int(job.get('quality', 90)), bool(job.get('keep_alpha', False)))
+
+
+def run_job(job, workers=None, log=None):
+    # Bir dönüşümü çalıştırır ve (yazılan öğe sayısı, atlanan dosyalar) döndürür.
+    command = job['command']
+    if command not in COMMANDS:
+        raise ValueError(f"Unknown command: {command}")
+    output = job['output']
+    resume = bool(job.get('resume', False))
+    skipped = []
+
+    def on_error(path, error):
+        skipped.append(path)
+        if log:
+            log(f"warning: skipping {path}: {error}")
+
+    if command in ('images-to-json', 'images-to-gif'):
+        paths = expand_inputs(job['inputs'], jft_engine.IMAGE_PATTERNS)
+        repeat_for = parse_repeat_specs(job.get('repeat'))
+        frames = [(path, repeat_for(path)) for path in paths]
+        if not frames:
+            raise ValueError("No input images")
+        if command == 'images-to-json':
+            stats = jft_engine.images_to_json(frames, output, workers=workers, options=export_options(job),
+                                              on_error=on_error, resume=resume)
+            count = stats.frames
+            if log:
+                log(stats.summary())
+        else:
+            count = jft_engine.images_to_gif(frames, output, int(job.get('duration', 100)),
+                                             optimize=bool(job.get('optimize_gif', False)), on_error=on_error,
+                                             workers=workers, resume=resume)
+    else:
+        paths = expand_inputs(job['inputs'], jft_engine.JSON_PATTERNS)
+        if not paths:
+            raise ValueError("No input JSON files")
+        if command == 'json-to-gif':
+            count = jft_engine.json_to_gif(paths, output, int(job.get('duration', 100)),
+                                           optimize=bool(job.get('optimize_gif', False)), on_error=on_error,
+                                           workers=workers, resume=resume)
+        else:
+            # Birleştirmede işçi havuzu yok; dosyalar besleyici iş parçacığında okunur
+            count = jft_engine.merge_json(paths, output, fast=not job.get('decode', False), on_error=on_error,
+                                          resume=resume)
+
+    if not count and command in ('images-to-gif', 'json-to-gif'):
+        os.remove(output)
+        raise ValueError("No valid frames to write")
+    return count, skipped
+
+
+def load_manifest(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    jobs = manifest.get('jobs') if isinstance(manifest, dict) else manifest
+    if not isinstance(jobs, list):
+        raise ValueError(f"{path} does not contain a job list")
+    # Göreli yollar iş dosyasının bulunduğu klasöre göre çözülür
+    base = os.path.dirname(os.path.abspath(path))
+    for job in jobs:
+        job['inputs'] = [os.path.join(base, item) for item in job.get('inputs', [])]
+        job['output'] = os.path.join(base, job['output'])
+    return jobs
+
+
+def run_batch(jobs, parallel=None):
+    # İşler ayrı süreçlerde paralel çalışır; her iş kendi içinde tek işçi kullanır.
+    failures = 0
+    with ProcessPoolExecutor(max_workers=parallel or jft_engine.default_worker_count()) as executor:
+        futures = {executor.submit(run_job, job, 1): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                count, skipped = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"error: {job.get('output')}: {e}", file=sys.stderr)
+                continue
+            for path in skipped:
+                print(f"warning: {job['output']}: skipped {path}", file=sys.stderr)
+            print(f"{job['output']}: {count} written")
+    return failures
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='jft_cli', description="Headless JFT conversions.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for command, help_text in (('images-to-json', "encode images into a save-history JSON file"),
+                               ('images-to-gif', "write images as an animated GIF"),
+                               ('json-to-gif', "write the frames of JSON files as an animated GIF"),
+                               ('merge-json', "merge JSON files into one")):
+        sub = subparsers.add_parser(command, help=help_text)
+        sub.add_argument('inputs', nargs='+', help="files, directories or glob patterns")
+        sub.add_argument('-o', '--output', required=True, help="output file")
+        sub.add_argument('--resume', action='store_true',
+                         help="checkpoint progress and continue an interrupted run with the same inputs")
+        if command.startswith('images-'):
+            sub.add_argument('-r', '--repeat', action='append', metavar='SPEC',
+                             help="repeat count, either N for all files or PATTERN=N (may be repeated)")
+        if command.endswith('-gif'):
+            sub.add_argument('-d', '--duration', type=int, default=100, help="frame duration in milliseconds")
+            sub.add_argument('--optimize-gif', action='store_true',
+                             help="shared palette and changed-region frames; smaller, drops transparency")
+        if command == 'images-to-json':
+            sub.add_argument('-w', '--workers', type=int, help="encoder processes (default: CPU count)")
+            sub.add_argument('--format', choices=jft_engine.ExportOptions.FORMATS, default='png',
+                             help="frame encoding (default: png)")
+            sub.add_argument('--compress-level', type=int, choices=range(10), default=6, metavar='0-9',
+                             help="PNG compression level (default: 6)")
+            sub.add_argument('--quality', type=int, default=90, help="WebP/JPEG quality, 1-100 (default: 90)")
+            sub.add_argument('--optimize', action='store_true', help="optimize PNG/JPEG output")
+            sub.add_argument('--passthrough', action='store_true',
+                             help="copy PNG sources into the JSON without re-encoding")
+            sub.add_argument('--keep-alpha', action='store_true', help="keep transparency for PNG/WebP")
+        if command == 'merge-json':
+            sub.add_argument('--decode', action='store_true',
+                             help="decode and re-encode items instead of copying raw bytes")
+
+    batch = subparsers.add_parser('batch', help="run the jobs of a JSON manifest in parallel")
+    batch.add_argument('manifest', help="JSON job list")
+    batch.add_argument('-j', '--jobs', type=int, help="jobs to run at once (default: CPU count)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == 'batch':
+            return 1 if run_batch(load_manifest(args.manifest), args.jobs) else 0
+        job = {key: value for key, value in vars(args).items() if value is not None}
+        count, _ = run_job(job, workers=job.pop('workers', None),
+                           log=lambda message: print(message, file=sys.stderr))
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        if getattr(args, 'resume', False):
+            print("interrupted; run the same command again to resume", file=sys.stderr)
+        return 130
+    print(f"{args.output}: {count} written")
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
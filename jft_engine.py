@@ -0,0 +1,2333 @@
+import contextlib
+import fnmatch
+import io
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+# Bu modül tkinter içermez; işçi süreçler yalnızca bunu içe aktarır.
+# PIL, json, base64, hashlib, concurrent.futures, tempfile ve pickle ilk kullanıldıkları işlevde
+# içe aktarılır; arayüzün açılışı bunları beklemez.
+
+
+def default_worker_count():
+    return os.cpu_count() or 1
+
+
+IMAGE_PATTERNS = ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp')
+JSON_PATTERNS = ('*.json',)
+
+
+def natural_sort_key(s):
+    return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', s)]
+
+
+class ScanEntry:
+    # st_size/st_mtime_ns adları os.stat_result ile aynıdır; ImageInfoCache'e
+    # stat yerine verilebilir.
+    __slots__ = ('path', 'st_size', 'st_mtime_ns', 'sort_key')
+
+    def __init__(self, path, st_size, st_mtime_ns, sort_key):
+        self.path = path
+        self.st_size = st_size
+        self.st_mtime_ns = st_mtime_ns
+        self.sort_key = sort_key
+
+
+def scan_directory(root, patterns=None, recursive=True, workers=8, cancel_event=None):
+    # root altındaki eşleşen dosyaları doğal sırayla ScanEntry olarak döndürür.
+    # Klasörler os.scandir ile paralel taranır; her yol parçasının sıralama
+    # anahtarı bir kez hesaplanıp alt öğelerce paylaşılır.
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    match = _pattern_matcher(patterns)
+    entries = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        pending = {executor.submit(_scan_one, root, (), match, recursive)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                entries.extend(files)
+                if cancel_event is not None and cancel_event.is_set():
+                    continue
+                for path, key in subdirs:
+                    pending.add(executor.submit(_scan_one, path, key, match, recursive))
+    entries.sort(key=lambda entry: entry.sort_key)
+    return entries
+
+
+def _pattern_matcher(patterns):
+    if not patterns:
+        return lambda name: True
+    patterns = [pattern.lower() for pattern in patterns]
+    # "*.ext" biçimindeki desenler fnmatch yerine endswith ile denetlenir
+    suffixes = tuple(pattern[1:] for pattern in patterns
+                     if pattern.startswith('*.') and not any(c in pattern[1:] for c in '*?['))
+    globs = [pattern for pattern in patterns if pattern[1:] not in suffixes]
+    if not globs:
+        return lambda name: name.lower().endswith(suffixes)
+    return lambda name: (name.lower().endswith(suffixes)
+                         or any(fnmatch.fnmatchcase(name.lower(), pattern) for pattern in globs))
+
+
+def _scan_one(directory, key, match, recursive):
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    # Sembolik bağlantılı klasörler döngüye girmemek için izlenmez
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append((entry.path, key + (natural_sort_key(entry.name),)))
+                    elif entry.is_file() and match(entry.name):
+                        stat = entry.stat()
+                        files.append(ScanEntry(entry.path, stat.st_size, stat.st_mtime_ns,
+                                               key + (natural_sort_key(entry.name),)))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def content_digest(data):
+    import hashlib
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ConversionCancelled(Exception):
+    pass
+
+
+_NO_STAGE = object()
+
+
+class Pipeline:
+    # Öğeleri aşamalı işçilerden geçirir, sonuçları giriş sırasıyla verir:
+    #   items        besleyici iş parçacığında gezilir (ör. JSON ayrıştırıcı)
+    #   read(item)   dosya G/Ç'si için `readers` iş parçacığında
+    #   process(x)   `workers` iş parçacığında, processes=True ise süreçlerde;
+    #                tek işçide okuyucuda çalışır
+    #   çağıran      run()'ı gezip yazar; tek sıralı yazıcıdır
+    # En fazla queue_size öğe yoldadır; yavaş yazıcı okuyucuları bekletir ve
+    # bellek sabit kalır. run() (item, result, error) verir; items gezilirken
+    # çıkan hata çağıranda yükselir. cancel_event ya da döngüden erken çıkış
+    # tüm aşamaları durdurur; iptal ConversionCancelled yükseltir.
+    def __init__(self, read=None, process=None, readers=2, workers=None, queue_size=None,
+                 processes=False, cancel_event=None):
+        self.read = read
+        self.process = process
+        self.readers = max(readers, 1)
+        self.workers = workers or default_worker_count()
+        self.queue_size = max(queue_size or self.workers * 2, 1)
+        self.processes = processes
+        self.cancel_event = cancel_event
+
+    def run(self, items):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        self._stop = threading.Event()
+        self._readers = self._pool = None
+        if self.read is not None or (self.process is not None and self.workers == 1):
+            self._readers = ThreadPoolExecutor(max_workers=self.readers)
+        if self.process is not None and self.workers > 1:
+            executor = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+            self._pool = executor(max_workers=self.workers)
+        results = queue.Queue(maxsize=self.queue_size)
+        feeder = threading.Thread(target=self._feed, args=(items, results), daemon=True)
+        feeder.start()
+        try:
+            while True:
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    raise ConversionCancelled()
+                try:
+                    entry = results.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if entry is _NO_STAGE:
+                    return
+                item, future = entry
+                if future is _NO_STAGE:
+                    yield item, item, None
+                    continue
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if item is _NO_STAGE:
+                        raise e  # kaynak yineleyicinin hatası
+                    yield item, None, e
+                else:
+                    yield item, result, None
+        finally:
+            self._stop.set()
+            for pool in (self._readers, self._pool):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            feeder.join()
+
+    def _feed(self, items, results):
+        # Besleyici iş parçacığı: öğeleri sırayla aşamalara gönderir
+        try:
+            for item in items:
+                if self._stop.is_set():
+                    return
+                if self.read is None and self.process is None:
+                    entry = (item, _NO_STAGE)
+                else:
+                    entry = (item, self._submit(item))
+                if not self._put(results, entry):
+                    return
+        except BaseException as e:
+            from concurrent.futures import Future
+
+            failed = Future()
+            failed.set_exception(e)
+            self._put(results, (_NO_STAGE, failed))
+            return
+        self._put(results, _NO_STAGE)
+
+    def _put(self, results, entry):
+        while not self._stop.is_set():
+            try:
+                results.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _submit(self, item):
+        from concurrent.futures import Future
+
+        if self._pool is None:
+            # Okuma ve işleme aynı okuyucu iş parçacığında art arda çalışır
+            return self._readers.submit(self._read_and_process, item)
+        if self.read is None:
+            return self._pool.submit(self.process, item)
+        done = Future()
+
+        def after_read(future):
+            try:
+                data = future.result()
+                processed = self._pool.submit(self.process, data)
+            except BaseException as e:
+                done.set_exception(e)
+                return
+            processed.add_done_callback(lambda future: _copy_future(future, done))
+        self._readers.submit(self.read, item).add_done_callback(after_read)
+        return done
+
+    def _read_and_process(self, item):
+        data = self.read(item) if self.read is not None else item
+        return self.process(data) if self.process is not None else data
+
+
+def _copy_future(source, target):
+    try:
+        target.set_result(source.result())
+    except BaseException as e:
+        target.set_exception(e)
+
+
+class ExportOptions:
+    # JSON dışa aktarmada karelerin data URL'ye kodlanışı. Varsayılanlar eski
+    # çıktıyla aynıdır: Pillow varsayılanlarıyla RGB PNG.
+    FORMATS = ('png', 'webp', 'jpeg')
+
+    __slots__ = ('format', 'compress_level', 'optimize', 'passthrough', 'quality', 'keep_alpha')
+
+    def __init__(self, format='png', compress_level=6, optimize=False, passthrough=False,
+                 quality=90, keep_alpha=False):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        self.format = format
+        self.compress_level = compress_level  # PNG, 0-9
+        self.optimize = optimize  # PNG/JPEG
+        self.passthrough = passthrough  # PNG kaynaklar yeniden kodlanmadan kopyalanır
+        self.quality = quality  # WebP/JPEG, 1-100
+        self.keep_alpha = keep_alpha  # PNG/WebP; JPEG her zaman RGB'dir
+
+    def key(self):
+        # Önbellek anahtarlarında kullanılır; seçenek değişince kareler yeniden kodlanır
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def encode_image(path, options=None):
+    with open(path, 'rb') as f:
+        return encode_image_data(f.read(), options)
+
+
+def encode_image_data(data, options=None):
+    import base64
+    from PIL import Image
+
+    options = options or ExportOptions()
+    if options.passthrough and options.format == 'png' and data.startswith(_PNG_SIGNATURE):
+        return f"data:image/png;base64,{base64.b64encode(data).decode()}"
+
+    with Image.open(io.BytesIO(data)) as img:
+        has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+        mode = 'RGBA' if options.keep_alpha and has_alpha and options.format != 'jpeg' else 'RGB'
+        if img.mode != mode:
+            img = img.convert(mode)
+        buffered = io.BytesIO()
+        if options.format == 'png':
+            img.save(buffered, format="PNG", compress_level=options.compress_level, optimize=options.optimize)
+        elif options.format == 'webp':
+            img.save(buffered, format="WEBP", quality=options.quality)
+        else:
+            img.save(buffered, format="JPEG", quality=options.quality, optimize=options.optimize)
+    return f"data:image/{options.format};base64,{base64.b64encode(buffered.getvalue()).decode()}"
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _encode_claimed(source, options=None):
+    # İşçi süreçte çalışır; veri None ise içerik daha önceki bir girdide kodlanır.
+    # Hata, aynı içerikli sonraki dosyalar da atlansın diye özetle birlikte döner.
+    digest, data = source
+    if data is None:
+        return digest, None, None
+    try:
+        return digest, encode_image_data(data, options), None
+    except Exception as e:
+        return digest, None, e
+
+
+def iter_json_items(path, chunk_size=1 << 20):
+    # Kayıt geçmişi dosyasının karelerini tek tek verir. Üst düzey dizi,
+    # "data" dizisi olan nesne ya da tek nesne kabul edilir.
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _JsonStreamReader(f, chunk_size)
+        first = reader.peek()
+        if first == '[':
+            yield from reader.array_items()
+        elif first == '{':
+            yield from _iter_object_items(reader)
+        else:
+            yield reader.value()
+        if reader.peek() is not None:
+            raise ValueError(f"Extra data after JSON value in {path}")
+
+
+def _iter_object_items(reader):
+    reader.expect('{')
+    fields = {}
+    found_data = False
+    if reader.peek() == '}':
+        reader.expect('}')
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError("Expected a JSON object key")
+            reader.expect(':')
+            if key == 'data' and not found_data:
+                found_data = True
+                if reader.peek() == '[':
+                    yield from reader.array_items()
+                else:
+                    yield reader.value()
+            else:
+                fields[key] = reader.value()
+            if reader.peek() == ',':
+                reader.expect(',')
+            else:
+                reader.expect('}')
+                break
+    if not found_data:
+        yield fields
+
+
+class _JsonStreamReader:
+    def __init__(self, f, chunk_size):
+        import json
+
+        self._decoder = json.JSONDecoder()
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size):
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        data = self.f.read(max(size, self.chunk_size))
+        if not data:
+            self.eof = True
+        self.buffer += data
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n\ufeff':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return None
+            self._fill(self.chunk_size)
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' in JSON stream")
+        self.pos += 1
+
+    def value(self):
+        if self.peek() is None:
+            raise ValueError("Unexpected end of JSON stream")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:  # json.JSONDecodeError
+                if self.eof:
+                    raise
+                end = None
+            # Değer tamponun sonuna dayanıyorsa (ör. bölünmüş bir sayı) daha fazla oku
+            if end is not None and (self.eof or (end < len(self.buffer)
+                                                 and self.buffer[end] not in '0123456789.eE+-')):
+                self.pos = end
+                return value
+            # Tampon iki katına çıkarak büyür; büyük kareler tekrar tekrar taranmaz
+            self._fill(len(self.buffer) - self.pos)
+
+    def array_items(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+
+_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+_SCALAR = re.compile(rb'[^,\]}\s]+')
+_CLOSING = {ord('['): ord(']'), ord('{'): ord('}')}
+
+
+def iter_raw_json_items(path):
+    # iter_json_items ile aynı biçimler; her öğenin ham baytları çözülmeden
+    # verilir. Yalnızca yapı denetlenir; uzun base64 dizgeleri tek bir
+    # bytes.find ile atlanır.
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Empty JSON file: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            pos = _skip_whitespace(data, 3 if data[:3] == b'\xef\xbb\xbf' else 0)
+            if data[pos:pos + 1] == b'[':
+                end = yield from _iter_raw_array(data, pos)
+            elif data[pos:pos + 1] == b'{':
+                span = _find_raw_data_array(data, pos)
+                end = _skip_value(data, pos)
+                if span is None:
+                    yield data[pos:end]
+                elif data[span[0]:span[0] + 1] == b'[':
+                    yield from _iter_raw_array(data, span[0])
+                else:
+                    yield data[span[0]:span[1]]
+            else:
+                end = _skip_value(data, pos)
+                yield data[pos:end]
+            if _skip_whitespace(data, end) != len(data):
+                raise ValueError(f"Extra data after JSON value in {path}")
+
+
+def _iter_raw_array(data, pos):
+    # Kapanan parantezin hemen sonrasındaki konumu döndürür.
+    pos = _skip_whitespace(data, pos + 1)
+    if data[pos:pos + 1] == b']':
+        return pos + 1
+    while True:
+        end = _skip_value(data, pos)
+        yield data[pos:end]
+        pos = _skip_whitespace(data, end)
+        separator = data[pos:pos + 1]
+        if separator == b']':
+            return pos + 1
+        if separator != b',':
+            raise ValueError(f"Expected ',' or ']' at byte {pos}")
+        pos = _skip_whitespace(data, pos + 1)
+
+
+def _find_raw_data_array(data, pos):
+    # Üst düzey "data" değerinin (başlangıç, bitiş) aralığı; yoksa None.
+    import json
+
+    pos = _skip_whitespace(data, pos + 1)
+    if data[pos:pos + 1] == b'}':
+        return None
+    while True:
+        key_end = _skip_value(data, pos)
+        key = json.loads(data[pos:key_end])
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key at byte {pos}")
+        pos = _skip_whitespace(data, key_end)
+        if data[pos:pos + 1] != b':':
+            raise ValueError(f"Expected ':' at byte {pos}")
+        pos = _skip_whitespace(data, pos + 1)
+        end = _skip_value(data, pos)
+        if key == 'data':
+            return pos, end
+        pos = _skip_whitespace(data, end)
+        separator = data[pos:pos + 1]
+        if separator == b'}':
+            return None
+        if separator != b',':
+            raise ValueError(f"Expected ',' or '}}' at byte {pos}")
+        pos = _skip_whitespace(data, pos + 1)
+
+
+def _skip_whitespace(data, pos):
+    return _WHITESPACE.match(data, pos).end()
+
+
+def _skip_value(data, pos):
+    # pos'ta başlayan JSON değerinin hemen sonrasındaki konumu döndürür.
+    first = data[pos:pos + 1]
+    if first == b'"':
+        return _skip_string(data, pos)
+    if first in (b'[', b'{'):
+        stack = [_CLOSING[first[0]]]
+        pos += 1
+        while stack:
+            match = _STRUCTURAL.search(data, pos)
+            if not match:
+                raise ValueError("Unexpected end of JSON data")
+            char = data[match.start()]
+            if char == ord('"'):
+                pos = _skip_string(data, match.start())
+            elif char in _CLOSING:
+                stack.append(_CLOSING[char])
+                pos = match.end()
+            elif char == stack[-1]:
+                stack.pop()
+                pos = match.end()
+            else:
+                raise ValueError(f"Mismatched bracket at byte {match.start()}")
+        return pos
+    match = _SCALAR.match(data, pos)
+    if not match:
+        raise ValueError(f"Expected a JSON value at byte {pos}")
+    return match.end()
+
+
+def _skip_string(data, pos):
+    end = pos
+    while True:
+        end = data.find(b'"', end + 1)
+        if end < 0:
+            raise ValueError(f"Unterminated string at byte {pos}")
+        # Tırnaktan önce tek sayıda ters bölü varsa tırnak kaçışlıdır
+        backslashes = 0
+        while data[end - 1 - backslashes] == 0x5C:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return end + 1
+
+
+class GifWriter:
+    # Animasyonlu GIF'i kare kare yazar. Pillow'un save_all'ı gibi her karenin
+    # kendi renk tablosu olur ve yalnızca önceki kareden bu yana değişen
+    # dikdörtgen yazılır; bellekte yalnızca bu ve önceki kare tutulur. Son kare
+    # sonraki gelene dek bekletilir; art arda aynı kareler süreleri toplanarak
+    # birleşir.
+    MAX_DELAY = 0xFFFF  # santisaniye
+    CACHE_BYTES = 32 << 20  # GIF kipine getirilmiş karelerin önbelleği
+
+    def __init__(self, fp, loop=0):
+        self.fp = fp
+        self.loop = loop
+        self.size = None
+        self.frame_count = 0
+        self._pending = None  # ((saydamlık, blok), süre)
+        self._previous = None  # önceki tam kare ("P"); yalnızca değişen dikdörtgen yazılır
+        self._previous_rgba = None
+        self._last = None  # önceki karenin çağırandaki konumu (index)
+        self._frames = OrderedDict()  # içerik anahtarı -> GIF kipindeki kare
+        self._cached_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def write(self, img, duration, key=None, index=None):
+        # key, karenin içerik özetidir; verilirse kare önbelleğe alınır.
+        # index, karenin çağırandaki konumudur; devam ederken önceki kare oradan okunur.
+        if self.size is None:
+            self.size = img.size
+            self._write_header()
+        elif img.size != self.size:
+            img = img.crop((0, 0) + self.size)
+
+        frame = _normalize_gif_frame(img)
+        self._remember(key, frame)
+        self._write_frame(frame, duration, index)
+
+    @staticmethod
+    def prepare(img):
+        # İşçi iş parçacığında çalışır; kareyi yazıcının durumuna dokunmadan
+        # GIF kipine getirir (palet çıkarma karenin en pahalı adımıdır)
+        return img.size, _normalize_gif_frame(img)
+
+    def write_prepared(self, prepared, duration, key=None, index=None):
+        # Tuvalden farklı boyuttaki kare yazılmaz; çağıran write() ile yeniden dener
+        size, frame = prepared
+        if self.size is None:
+            self.size = size
+            self._write_header()
+        elif size != self.size:
+            return False
+        self._remember(key, frame)
+        self._write_frame(frame, duration, index)
+        return True
+
+    def _remember(self, key, frame):
+        if key is None or key in self._frames:
+            return
+        self._frames[key] = frame
+        self._cached_bytes += frame.width * frame.height
+        while self._cached_bytes > self.CACHE_BYTES and len(self._frames) > 1:
+            _, old = self._frames.popitem(last=False)
+            self._cached_bytes -= old.width * old.height
+
+    def write_cached(self, key, duration, index=None):
+        # key ile hazırlanmış kareyi yeniden çözmeden yazar; key önbellekte
+        # yoksa False döndürür.
+        frame = self._frames.get(key)
+        if frame is None:
+            return False
+        self._frames.move_to_end(key)
+        self._write_frame(frame, duration, index)
+        return True
+
+    def _write_frame(self, frame, duration, index):
+        # Pillow'un çok kareli kaydı gibi: önceki kareden farklı piksellerin
+        # dikdörtgeni kırpılıp konumuyla yazılır; fark yoksa süre eklenir
+        if self._previous is None:
+            bbox = (0, 0) + frame.size
+        else:
+            bbox = self._changed_bbox(frame)
+        self._previous, self._last = frame, index
+        if bbox is None:
+            if self._pending is not None:
+                encoded, pending_duration = self._pending
+                self._pending = (encoded, pending_duration + duration)
+            return
+        if bbox != (0, 0) + frame.size:
+            frame = frame.crop(bbox)
+        encoded = _encode_gif_frame(frame, bbox[:2])
+        self._flush()
+        self._pending = (encoded, duration)
+        self.frame_count += 1
+
+    def _changed_bbox(self, frame):
+        from PIL import ImageChops
+
+        previous = self._previous
+        if previous.mode == frame.mode and _palette_bytes(previous) == _palette_bytes(frame):
+            self._previous_rgba = None
+            return ImageChops.subtract_modulo(frame, previous).getbbox(alpha_only=False)
+        # Paletler farklıysa renkler karşılaştırılır; bu karenin RGBA hali sonrakinde kullanılır
+        if self._previous_rgba is None:
+            self._previous_rgba = previous.convert('RGBA')
+        current = frame.convert('RGBA')
+        bbox = ImageChops.subtract_modulo(current, self._previous_rgba).getbbox(alpha_only=False)
+        self._previous_rgba = current
+        return bbox
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        (transparency, block), duration = self._pending
+        self._pending = None
+        # Atma yöntemi 1: kare bir öncekinin üzerine çizilir (Pillow ile aynı)
+        packed = 1 << 2
+        if transparency is not None:
+            packed |= 1
+        # GIF gecikmesi 16 bit; çok uzun süreler aynı kareyi tekrar yazar
+        delay = max(int(round(duration / 10)), 0)
+        while True:
+            chunk = min(delay, self.MAX_DELAY)
+            self.fp.write(b'\x21\xf9\x04' + struct.pack('<BHB', packed, chunk, transparency or 0) + b'\x00')
+            self.fp.write(block)
+            delay -= chunk
+            if delay <= 0:
+                break
+
+    def checkpoint(self):
+        return (self.fp.tell(), self.size, self.frame_count, self._pending, self._previous,
+                self._previous_rgba, self._last)
+
+    def rollback(self, checkpoint):
+        # Kontrol noktasından sonra yazılan kareleri siler; o anda bekleyen
+        # kare yazılmış olsa bile yeniden beklemeye alınır
+        (offset, size, self.frame_count, self._pending, self._previous,
+         self._previous_rgba, self._last) = checkpoint
+        if size != self.size:
+            self._frames.clear()
+            self._cached_bytes = 0
+        self.size = size
+        self.fp.seek(offset)
+        self.fp.truncate()
+
+    def save_state(self):
+        # Devam kontrol noktası için JSON'a uygun yazıcı durumu. Bekleyen kare
+        # henüz dosyada olmadığından durumla saklanır; önceki kare `last`tan
+        # yeniden kurulur.
+        import base64
+
+        pending = None
+        if self._pending is not None:
+            (transparency, block), duration = self._pending
+            pending = [transparency, base64.b64encode(block).decode('ascii'), duration]
+        return {'size': self.size, 'frame_count': self.frame_count, 'pending': pending,
+                'last': self._last}
+
+    def restore_state(self, state, load_frame=None):
+        # Dosya kontrol noktasındaki konumdadır; başlık zaten yazılmıştır.
+        # load_frame(index) önceki kareyi kaynağından yeniden okur.
+        import base64
+
+        self.size = tuple(state['size']) if state['size'] else None
+        self.frame_count = state['frame_count']
+        pending = state['pending']
+        if pending is not None:
+            transparency, block, duration = pending
+            self._pending = ((transparency, base64.b64decode(block)), duration)
+        self._last = state['last']
+        if self.size is not None and self._last is not None:
+            frame = load_frame(self._last)
+            if frame.size != self.size:
+                frame = frame.crop((0, 0) + self.size)
+            self._previous = _normalize_gif_frame(frame)
+
+    def close(self):
+        self._flush()
+        if self.size is not None:
+            self.fp.write(b';')
+        self.fp.flush()
+
+    def _write_header(self):
+        width, height = self.size
+        self.fp.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0, 0, 0))
+        self.fp.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00')
+
+
+def _normalize_gif_frame(img):
+    # Pillow'un GIF kaydındaki kip dönüşümü: RGB(A) uyarlanır paletle "P" olur,
+    # paletteki tamamen saydam renk saydamlık indeksidir
+    from PIL import Image
+
+    if img.mode in ('1', 'L', 'P'):
+        img.load()
+        return img
+    if Image.getmodebase(img.mode) != 'RGB':
+        return img.convert('L')
+    frame = img.convert('P', palette=Image.Palette.ADAPTIVE)
+    if frame.palette.mode == 'RGBA':
+        for rgba, index in frame.palette.colors.items():
+            if rgba[3] == 0:
+                frame.info['transparency'] = index
+                break
+    return frame
+
+
+def _palette_bytes(img):
+    return (img.palette.mode, bytes(img.palette.palette)) if img.palette else None
+
+
+def _encode_gif_frame(img, offset=(0, 0)):
+    # Tek kare için (saydamlık indeksi, görüntü bloğu) döndürür; blok görüntü
+    # tanımlayıcısı, yerel renk tablosu ve LZW verisidir.
+    buffered = io.BytesIO()
+    img.save(buffered, format="GIF")
+    transparency, block = _split_gif_frame(buffered.getvalue())
+    if offset != (0, 0):
+        block = b'\x2c' + struct.pack('<HH', *offset) + block[5:]
+    return transparency, block
+
+
+def _encode_gif_indices(img):
+    # "P" görüntünün yalnızca LZW verisi. optimize=False Pillow'un paleti
+    # yeniden eşlemesini önler, indeksler genel paletle aynı kalır.
+    # OptimizedGifWriter'ın tanımlayıcısı taramalı (interlace) olmadığından
+    # satırlar sırayla saklanmalıdır.
+    buffered = io.BytesIO()
+    img.save(buffered, format="GIF", optimize=False, interlace=False)
+    block = _split_gif_frame(buffered.getvalue())[1]
+    flags = block[9]
+    table_size = 3 * (2 << (flags & 0x07)) if flags & 0x80 else 0
+    return block[10 + table_size:]
+
+
+def _split_gif_frame(data):
+    packed = data[10]
+    pos = 13
+    global_table = b''
+    table_bits = packed & 0x07
+    if packed & 0x80:
+        global_table = data[pos:pos + 3 * (2 << table_bits)]
+        pos += len(global_table)
+
+    transparency = None
+    while pos < len(data):
+        marker = data[pos]
+        if marker == 0x21:
+            if data[pos + 1] == 0xF9 and data[pos + 3] & 0x01:
+                transparency = data[pos + 6]
+            pos = _skip_sub_blocks(data, pos + 2)
+        elif marker == 0x2C:
+            left, top, width, height, flags = struct.unpack('<HHHHB', data[pos + 1:pos + 10])
+            pos += 10
+            if flags & 0x80:
+                color_table = data[pos:pos + 3 * (2 << (flags & 0x07))]
+                pos += len(color_table)
+            else:
+                color_table = global_table
+                flags = (flags & 0x40) | 0x80 | table_bits
+            start = pos
+            pos = _skip_sub_blocks(data, pos + 1)
+            descriptor = b'\x2c' + struct.pack('<HHHHB', left, top, width, height, flags)
+            return transparency, descriptor + color_table + data[start:pos]
+        else:
+            break
+    raise ValueError("Encoded GIF frame has no image data")
+
+
+def _skip_sub_blocks(data, pos):
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+class OptimizedGifWriter:
+    # Örnek karelerden kurulan tek genel paletle GIF yazar. Her kare yalnızca
+    # önceki kareden bu yana değişen dikdörtgeni saklar; içindeki değişmeyen
+    # pikseller saydamdır, disposal 1 önceki kareyi altta tutar. Değişmeyen
+    # kare öncekinin süresini uzatır. Kaynak karelerdeki saydamlık korunmaz.
+    MAX_DELAY = GifWriter.MAX_DELAY
+    TRANSPARENT = 255  # palet en fazla 255 renk kullanır; bu indeks saydamdır
+    SAMPLE_SIZE = 96  # paleti kurarken örnek karelerin küçültüldüğü boyut
+
+    def __init__(self, fp, samples=(), loop=0, chunk_size=None, use_numpy=None):
+        self.fp = fp
+        self.loop = loop
+        self.size = None
+        self.frame_count = 0
+        self.palette = build_gif_palette(samples, self.SAMPLE_SIZE) if samples else None
+        self.chunk_size = chunk_size
+        self.use_numpy = use_numpy  # None: NumPy kuruluysa kullanılır
+        self.analyzer = None
+        self._batch = []  # henüz çözümlenmemiş (RGB kare, süre, konum) üçlüleri
+        self._previous = None  # önceki karenin indeksleri (FrameAnalyzer durumu)
+        self._pending = None  # (bbox, LZW verisi, saydam indeks, süre)
+        self._last = None  # son çözümlenen karenin çağırandaki konumu (index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def write(self, img, duration, key=None, index=None):
+        # index, karenin çağırandaki konumudur; devam ederken önceki kare oradan
+        # yeniden okunur
+        if self.size is None:
+            self.size = img.size
+            if self.palette is None:
+                self.palette = build_gif_palette([img], self.SAMPLE_SIZE)
+            self.analyzer = FrameAnalyzer(self.palette, self.TRANSPARENT, self.chunk_size, self.use_numpy)
+            self._write_header()
+        elif img.size != self.size:
+            img = img.crop((0, 0) + self.size)
+
+        # Kareler parçalar halinde çözümlenir; bellekte en fazla chunk_size kare bekler
+        self._batch.append((img.convert('RGB'), duration, index))
+        if len(self._batch) >= self.analyzer.chunk_size:
+            self._analyze()
+
+    def _analyze(self):
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        results = self.analyzer.analyze([frame for frame, _, _ in batch], self._previous)
+        for (state, bbox, rect), (_, duration, index) in zip(results, batch):
+            transparent = self._previous is not None
+            self._previous = state
+            self._last = index
+            if bbox is None:
+                bbox_, lzw_data, transparent, pending_duration = self._pending
+                self._pending = (bbox_, lzw_data, transparent, pending_duration + duration)
+                continue
+            self._flush()
+            self._pending = (bbox, _encode_gif_indices(rect), transparent, duration)
+            self.frame_count += 1
+
+    @staticmethod
+    def prepare(img):
+        # Kareler arası fark sıralı hesaplanır; işçide yalnızca çözülür
+        return img.convert('RGB')
+
+    def write_prepared(self, prepared, duration, key=None, index=None):
+        self.write(prepared, duration, key, index)
+        return True
+
+    def write_cached(self, key, duration, index=None):
+        # Özdeş kareler fark karşılaştırmasıyla birleşir; kare önbelleği yoktur
+        return False
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        (left, top, right, bottom), lzw_data, transparent, duration = self._pending
+        self._pending = None
+        packed = (1 << 2) | (1 if transparent else 0)
+        descriptor = b'\x2c' + struct.pack('<HHHHB', left, top, right - left, bottom - top, 0)
+        delay = max(int(round(duration / 10)), 0)
+        while True:
+            chunk = min(delay, self.MAX_DELAY)
+            self.fp.write(b'\x21\xf9\x04' + struct.pack('<BHB', packed, chunk, self.TRANSPARENT) + b'\x00')
+            self.fp.write(descriptor + lzw_data)
+            delay -= chunk
+            if delay <= 0:
+                break
+
+    def checkpoint(self):
+        self._analyze()
+        return (self.fp.tell(), self.size, self.frame_count, self._pending, self._previous,
+                self._last, self.palette, self.analyzer)
+
+    def rollback(self, checkpoint):
+        self._batch = []
+        (offset, self.size, self.frame_count, self._pending, self._previous,
+         self._last, self.palette, self.analyzer) = checkpoint
+        self.fp.seek(offset)
+        self.fp.truncate()
+
+    def save_state(self):
+        # GifWriter.save_state gibi. Önceki karenin indeksleri saklanmaz;
+        # restore_state() son kareyi yeniden analiz ederek aynılarını kurar.
+        import base64
+
+        self._analyze()
+        pending = None
+        if self._pending is not None:
+            bbox, lzw_data, transparent, duration = self._pending
+            pending = [list(bbox), base64.b64encode(lzw_data).decode('ascii'), transparent, duration]
+        palette = self.palette.getpalette() if self.palette is not None else None
+        return {'size': self.size, 'frame_count': self.frame_count, 'pending': pending,
+                'palette': palette, 'last': self._last}
+
+    def restore_state(self, state, load_frame=None):
+        # load_frame(index) son çözümlenen kareyi kaynağından yeniden okur
+        import base64
+        from PIL import Image
+
+        if state['palette'] is not None:
+            self.palette = Image.new('P', (1, 1))
+            self.palette.putpalette(state['palette'])
+        self.frame_count = state['frame_count']
+        pending = state['pending']
+        if pending is not None:
+            bbox, lzw_data, transparent, duration = pending
+            self._pending = (tuple(bbox), base64.b64decode(lzw_data), transparent, duration)
+        if not state['size']:
+            return
+        self.size = tuple(state['size'])
+        self.analyzer = FrameAnalyzer(self.palette, self.TRANSPARENT, self.chunk_size, self.use_numpy)
+        self._last = state['last']
+        if self._last is not None:
+            frame = load_frame(self._last).convert('RGB')
+            if frame.size != self.size:
+                frame = frame.crop((0, 0) + self.size)
+            self._previous = self.analyzer.analyze([frame], None)[0][0]
+
+    def close(self):
+        self._analyze()
+        self._flush()
+        if self.size is not None:
+            self.fp.write(b';')
+        self.fp.flush()
+
+    def _write_header(self):
+        width, height = self.size
+        palette = bytes(self.palette.getpalette()[:768]).ljust(768, b'\x00')
+        # Genel renk tablosu: 256 giriş, renk çözünürlüğü 8 bit
+        self.fp.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF7, 0, 0) + palette)
+        self.fp.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00')
+
+
+_UNCHANGED_LUT = [255] + [0] * 255
+
+
+def _load_numpy():
+    # NumPy isteğe bağlıdır; yoksa Pillow ile aynı sonuç üretilir
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class FrameAnalyzer:
+    # RGB kareleri sabit palete eşler ve önceki kareden bu yana değişen
+    # dikdörtgeni bulur. NumPy varsa renkler 6 bitlik RGB arama tablosuyla
+    # eşlenir, satırlar 8 baytlık sözcükler olarak karşılaştırılır; yoksa her
+    # kare Pillow quantize ve ImageChops'tan geçer. analyze() kare başına
+    # (state, bbox, rect) verir: state sonraki çağrıda `previous` olur, bbox
+    # değişmeyen karede None'dır, rect değişmeyen pikselleri saydam indekste
+    # olan "P" görüntüdür.
+    LUT_BITS = 6
+    # Kareleri yığına kopyalamak toplu karşılaştırmanın kazancından pahalıdır;
+    # bench_frames.py'de tek kare en hızlısıdır
+    DEFAULT_CHUNK_SIZE = 1
+
+    def __init__(self, palette, transparent, chunk_size=None, use_numpy=None):
+        self.palette = palette
+        self.transparent = transparent
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.np = _load_numpy() if use_numpy is not False else None
+        if use_numpy and self.np is None:
+            raise ImportError("NumPy is not installed")
+        self._lut = None
+
+    def analyze(self, frames, previous):
+        if self.np is None:
+            return self._analyze_pillow(frames, previous)
+        return self._analyze_numpy(frames, previous)
+
+    def _analyze_pillow(self, frames, previous):
+        from PIL import Image, ImageChops
+
+        results = []
+        for frame in frames:
+            quantized = frame.quantize(palette=self.palette, dither=Image.Dither.NONE)
+            indices = Image.frombytes('L', frame.size, quantized.tobytes())
+            if previous is None:
+                results.append((indices, (0, 0) + frame.size, quantized))
+            else:
+                diff = ImageChops.difference(indices, previous)
+                bbox = diff.getbbox()
+                if bbox is None:
+                    results.append((previous, None, None))
+                    continue
+                rect = quantized.crop(bbox)
+                rect.paste(self.transparent, mask=diff.crop(bbox).point(_UNCHANGED_LUT))
+                results.append((indices, bbox, rect))
+            previous = indices
+        return results
+
+    def _analyze_numpy(self, frames, previous):
+        # Önce ham RGB karşılaştırılır; palete yalnızca değişen dikdörtgen eşlenir.
+        # Durum (rgb, indeksler) çiftidir.
+        np = self.np
+        width, height = frames[0].size
+        count = len(frames)
+        flat = np.empty((count, height, width * 3), dtype=np.uint8)
+        for n, frame in enumerate(frames):
+            flat[n] = np.frombuffer(frame.tobytes(), dtype=np.uint8).reshape(height, width * 3)
+        stack = flat.reshape(count, height, width, 3)
+        reference = previous[0].reshape(height, width * 3) if previous is not None else None
+
+        # Satırlar 8 baytlık sözcüklerle karşılaştırılır; sütunlar yalnızca değişen bantta aranır
+        words = flat.view(np.uint64) if width * 3 % 8 == 0 else flat
+        rows = np.empty((count, height), dtype=bool)
+        rows[1:] = (words[1:] != words[:-1]).any(axis=2)
+        if reference is None:
+            rows[0] = True
+        else:
+            rows[0] = (words[0] != reference.view(words.dtype)).any(axis=1)
+
+        results = []
+        for n in range(count):
+            row_hits = np.flatnonzero(rows[n])
+            if not row_hits.size:
+                results.append((previous, None, None))
+                continue
+            top, bottom = row_hits[0], row_hits[-1] + 1
+            if n:
+                reference = flat[n - 1]
+            if reference is None:
+                left, right = 0, width
+            else:
+                band = flat[n, top:bottom] != reference[top:bottom]
+                col_hits = np.flatnonzero(band.any(axis=0).reshape(width, 3).any(axis=1))
+                left, right = col_hits[0], col_hits[-1] + 1
+            area = self._map_colors(stack[n, top:bottom, left:right])
+            if previous is None:
+                indices = area
+            else:
+                indices = previous[1].copy()
+                unchanged = area == indices[top:bottom, left:right]
+                changed_pixels = ~unchanged
+                area_rows = np.flatnonzero(changed_pixels.any(axis=1))
+                if not area_rows.size:
+                    # RGB değişti ama palet indeksleri aynı: kare öncekinin süresine eklenir
+                    previous = (stack[n], previous[1])
+                    results.append((previous, None, None))
+                    continue
+                area_cols = np.flatnonzero(changed_pixels.any(axis=0))
+                indices[top:bottom, left:right] = area
+                inner = (slice(area_rows[0], area_rows[-1] + 1), slice(area_cols[0], area_cols[-1] + 1))
+                top, bottom = top + area_rows[0], top + area_rows[-1] + 1
+                left, right = left + area_cols[0], left + area_cols[-1] + 1
+                area = area[inner]
+                area[unchanged[inner]] = self.transparent
+            previous = (stack[n], indices)
+            bbox = (int(left), int(top), int(right), int(bottom))
+            results.append((previous, bbox, self._image(area)))
+        return results
+
+    def _map_colors(self, rgb):
+        np = self.np
+        bits = self.LUT_BITS
+        shifted = rgb >> (8 - bits)
+        keys = shifted[..., 0].astype(np.uint32) << (2 * bits)
+        keys |= shifted[..., 1].astype(np.uint16) << bits
+        keys |= shifted[..., 2]
+        return self._color_lut()[keys]
+
+    def _image(self, indices):
+        from PIL import Image
+
+        height, width = indices.shape
+        return Image.frombytes('P', (width, height), self.np.ascontiguousarray(indices).tobytes())
+
+    def _color_lut(self):
+        # 6 bitlik her RGB kutusunun merkezi tek bir görüntüde Pillow ile palete eşlenir
+        if self._lut is None:
+            from PIL import Image
+
+            np = self.np
+            bits = self.LUT_BITS
+            levels = (np.arange(1 << bits, dtype=np.uint8) << (8 - bits)) + (1 << (7 - bits))
+            grid = np.stack(np.meshgrid(levels, levels, levels, indexing='ij'), axis=-1)
+            centers = Image.frombytes('RGB', (1 << bits, 1 << (2 * bits)), grid.tobytes())
+            mapped = centers.quantize(palette=self.palette, dither=Image.Dither.NONE)
+            self._lut = np.frombuffer(mapped.tobytes(), dtype=np.uint8)
+        return self._lut
+
+
+def build_gif_palette(samples, sample_size=96, colors=255):
+    # Örnekler en yakın komşu ile küçültülüp yan yana dizilir; böylece palet
+    # karelerde gerçekten bulunan renklerden kurulur
+    from PIL import Image
+
+    thumbs = []
+    for sample in samples:
+        thumb = sample.convert('RGB')
+        thumb.thumbnail((sample_size, sample_size), Image.Resampling.NEAREST)
+        thumbs.append(thumb)
+    strip = Image.new('RGB', (sum(thumb.width for thumb in thumbs), max(thumb.height for thumb in thumbs)))
+    x = 0
+    for thumb in thumbs:
+        strip.paste(thumb, (x, 0))
+        x += thumb.width
+    quantized = strip.quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+    palette = Image.new('P', (1, 1))
+    palette.putpalette(quantized.getpalette()[:colors * 3])
+    return palette
+
+
+def iter_gif_frames(path):
+    # Kareler (RGBA kare, süre) olarak sırayla çözülür; süre her karenin kendi değeridir
+    from PIL import Image
+
+    with Image.open(path) as gif:
+        default_duration = gif.info.get('duration') or 100
+        index = 0
+        while True:
+            try:
+                gif.seek(index)
+            except EOFError:
+                return
+            yield gif.convert('RGBA'), gif.info.get('duration') or default_duration
+            index += 1
+
+
+def fit_size(size, max_size):
+    # En-boy oranını koruyarak max_size içine sığdırır; asla büyütmez
+    width, height = size
+    max_width, max_height = max_size
+    if width <= max_width and height <= max_height:
+        return width, height
+    ratio = min(max_width / width, max_height / height)
+    return max(int(width * ratio), 1), max(int(height * ratio), 1)
+
+
+class PreviewFrames:
+    # Oynatma için kareleri arka planda, gösterimin birkaç kare önünden ve
+    # `size`'a küçülterek çözer. Tampon sınırlı olduğundan bellek animasyonun
+    # uzunluğundan bağımsızdır. `source` (görüntü, süre) yineleyicisi döndüren
+    # bir çağrılabilirdir; her döngüde yeniden çağrılır.
+    BUFFER_FRAMES = 8
+
+    def __init__(self, source, size, buffer_frames=None, loop=True):
+        self.source = source
+        self.size = size
+        self.loop = loop
+        self.error = None
+        self._buffer = queue.Queue(maxsize=buffer_frames or self.BUFFER_FRAMES)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def next_frame(self):
+        # Sıradaki (kare, süre) çifti; okuma henüz yetişmediyse None
+        try:
+            return self._buffer.get_nowait()
+        except queue.Empty:
+            return None
+
+    @property
+    def done(self):
+        return not self._thread.is_alive() and self._buffer.empty()
+
+    def close(self):
+        self._stop.set()
+
+    def _run(self):
+        from PIL import Image
+
+        try:
+            while not self._stop.is_set():
+                count = 0
+                for frame, duration in self.source():
+                    if frame.size != self.size:
+                        frame = frame.resize(self.size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+                    if not self._put((frame, duration)):
+                        return
+                    count += 1
+                # Tek karelik bir animasyon yeniden çözülmez
+                if not self.loop or count < 2:
+                    return
+        except Exception as e:
+            self.error = e
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class ImageInfo:
+    __slots__ = ('format', 'width', 'height', 'mode', 'valid')
+
+    def __init__(self, format, width, height, mode, valid=True):
+        self.format = format
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.valid = valid
+
+
+_INVALID_IMAGE = ImageInfo(None, 0, 0, None, False)
+_PNG_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+_JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+_SNIFF_SIZE = 1 << 16
+
+
+def sniff_image(path):
+    # Yalnızca dosya başlığını okur. Biçim yaygın olanlardan değilse ya da
+    # başlık çözülemezse None döner; çağıran tam Pillow doğrulamasına geçer.
+    with open(path, 'rb') as f:
+        head = f.read(_SNIFF_SIZE)
+    try:
+        if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+            width, height, depth, color = struct.unpack_from('>IIBB', head, 16)
+            mode = _PNG_MODES.get(color)
+            if mode == 'L' and depth == 1:
+                mode = '1'
+            info = ImageInfo('PNG', width, height, mode)
+        elif head[:6] in (b'GIF87a', b'GIF89a'):
+            width, height = struct.unpack_from('<HH', head, 6)
+            info = ImageInfo('GIF', width, height, 'P')
+        elif head[:2] == b'BM':
+            (dib_size,) = struct.unpack_from('<I', head, 14)
+            if dib_size == 12:
+                width, height, _, bits = struct.unpack_from('<HHHH', head, 18)
+            else:
+                width, height, _, bits = struct.unpack_from('<iiHH', head, 18)
+            info = ImageInfo('BMP', abs(width), abs(height), 'P' if bits <= 8 else 'RGB')
+        elif head[:2] == b'\xff\xd8':
+            info = _sniff_jpeg(head)
+        else:
+            return None
+    except struct.error:
+        return None
+    if info is None or info.mode is None or not info.width or not info.height:
+        return None
+    return info
+
+
+def _sniff_jpeg(head):
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        (length,) = struct.unpack_from('>H', head, pos + 2)
+        # SOF işaretleri; C4 (DHT), C8 ve CC (DAC) hariç
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            _, height, width, components = struct.unpack_from('>BHHB', head, pos + 4)
+            return ImageInfo('JPEG', width, height, _JPEG_MODES.get(components))
+        pos += 2 + length
+    return None
+
+
+def probe_image(path):
+    try:
+        info = sniff_image(path)
+        if info is not None:
+            return info
+        from PIL import Image
+
+        with Image.open(path) as img:
+            info = ImageInfo(img.format, img.width, img.height, img.mode)
+            img.verify()
+        return info
+    except Exception:
+        return _INVALID_IMAGE
+
+
+class ImageInfoCache:
+    # Yolu, dosyanın (boyut, mtime) anındaki ImageInfo'suna eşler. Değişmemiş
+    # bir dosya yalnızca bir stat'a mal olur.
+    def __init__(self):
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path, stat=None):
+        try:
+            stat = stat or os.stat(path)
+        except OSError:
+            return _INVALID_IMAGE
+        key = (stat.st_size, stat.st_mtime_ns)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        info = probe_image(path)
+        self._entries[path] = (key, info)
+        return info
+
+    def export(self, path):
+        # Oturum dosyasına yazılacak meta veri bloğu
+        import json
+
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        (size, mtime_ns), info = entry
+        return json.dumps({'size': size, 'mtime_ns': mtime_ns, 'format': info.format,
+                           'width': info.width, 'height': info.height, 'mode': info.mode,
+                           'valid': info.valid}).encode('utf-8')
+
+    def restore(self, path, blob):
+        import json
+
+        try:
+            data = json.loads(blob.decode('utf-8'))
+            self._entries[path] = ((data['size'], data['mtime_ns']),
+                                   ImageInfo(data['format'], data['width'], data['height'],
+                                             data['mode'], data['valid']))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+
+class EncodedFrameCache:
+    # Anahtar -> (içerik özeti, data URL); en eski kullanılan girdiler toplam
+    # boyut max_bytes'ı aşınca atılır. Tek başına sınırı aşan girdi saklanmaz.
+    DEFAULT_BYTES = 64 << 20
+
+    def __init__(self, max_bytes=DEFAULT_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def __delitem__(self, key):
+        _, data_url = self._entries.pop(key)
+        self._bytes -= len(data_url)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        if key in self._entries:
+            del self[key]
+        size = len(entry[1])
+        if size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, data_url) = self._entries.popitem(last=False)
+            self._bytes -= len(data_url)
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+
+def default_cache_dir():
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'jft')
+
+
+def make_thumbnail(path, size):
+    # Oranı korunarak size içine küçültülmüş PNG baytları
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img.draft('RGB', size)  # JPEG'ler küçültülerek çözülür
+        img.thumbnail(size)
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'A' in img.getbands() or 'transparency' in img.info else 'RGB')
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class ThumbnailCache:
+    # Kalıcı küçük resimler: her girdi (yol, boyut, mtime, küçük resim boyutu)
+    # özetiyle adlandırılmış bir PNG dosyasıdır; değişen dosya yeni girdi alır.
+    # Okunan girdinin mtime'ı güncellenir, klasör max_bytes'ı aşınca en uzun
+    # süredir kullanılmayanlar silinir. Birden çok iş parçacığından çağrılabilir.
+    def __init__(self, directory=None, size=(48, 48), max_bytes=64 << 20):
+        self.directory = directory or os.path.join(default_cache_dir(), 'thumbnails')
+        self.size = size
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = None  # ilk yazmada klasör taranarak bulunur
+
+    def entry_path(self, path, stat=None):
+        stat = stat or os.stat(path)
+        ident = f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}\0{self.size[0]}x{self.size[1]}"
+        key = content_digest(ident.encode('utf-8', 'surrogatepass')).hex()
+        return os.path.join(self.directory, key[:2], key + '.png')
+
+    def get(self, path, stat=None):
+        # Önbellekteki PNG baytları; yoksa üretilip kaydedilir
+        entry = self.entry_path(path, stat)
+        try:
+            with open(entry, 'rb') as f:
+                data = f.read()
+            os.utime(entry)
+            return data
+        except OSError:
+            pass
+        data = make_thumbnail(path, self.size)
+        try:
+            self._store(entry, data)
+        except OSError:
+            pass  # Önbellek yazılamıyorsa küçük resim yine de kullanılır
+        return data
+
+    def _store(self, entry, data):
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        temp = f"{entry}.{threading.get_ident()}.tmp"
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, entry)
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += len(data)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith('.png'):
+                    stat = entry.stat()
+                    yield stat.st_mtime_ns, stat.st_size, entry.path
+
+    def _evict(self):
+        # En eski kullanılanlar silinir; sınırın %90'ına inilir
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * 9 // 10
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._total = total
+
+
+# .jft oturum dosyası:
+#   başlık    : SESSION_MAGIC, sürüm (u16), bayraklar (u16), JSON başlık uzunluğu (u32), JSON başlık
+#   kayıtlar  : her biri u32 uzunluk + _RECORD_FIELDS + yol, görünen ad ve not (u32 uzunluk + UTF-8)
+#   veri alanı: kayıtların ofsetle gösterdiği küçük resim ve meta veri blokları
+SESSION_MAGIC = b'JFTSESS\x00'
+SESSION_VERSION = 1
+_SESSION_HEADER = struct.Struct('<8sHHI')
+_RECORD_FIELDS = struct.Struct('<IQIQI')  # tekrar, küçük resim konum/uzunluk, meta veri konum/uzunluk
+_LENGTH = struct.Struct('<I')
+
+
+class SessionRecord:
+    __slots__ = ('path', 'filename', 'repeat', 'note', 'thumbnail', 'metadata',
+                 'thumbnail_span', 'metadata_span')
+
+    def __init__(self, path, filename, repeat=1, note='', thumbnail=None, metadata=None):
+        self.path = path
+        self.filename = filename
+        self.repeat = repeat
+        self.note = note
+        self.thumbnail = thumbnail  # bytes veya None
+        self.metadata = metadata  # bytes veya None
+        # Okunan kayıtlarda blokların (ofset, uzunluk) değeri; read_blob ile okunur
+        self.thumbnail_span = None
+        self.metadata_span = None
+
+
+def write_session(path, records, **header):
+    import json
+    import tempfile
+
+    records = list(records)
+    header = dict(header, record_count=len(records))
+    header_bytes = json.dumps(header).encode('utf-8')
+
+    encoded = []
+    table_size = 0
+    for record in records:
+        strings = b''.join(_LENGTH.pack(len(value)) + value for value in
+                           (record.path.encode('utf-8'), record.filename.encode('utf-8'),
+                            record.note.encode('utf-8')))
+        encoded.append(strings)
+        table_size += _LENGTH.size + _RECORD_FIELDS.size + len(strings)
+
+    # Bloklar kayıt tablosunun hemen arkasından başlar
+    blob_offset = _SESSION_HEADER.size + len(header_bytes) + table_size
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as f:
+        try:
+            f.write(_SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, 0, len(header_bytes)))
+            f.write(header_bytes)
+            blobs = []
+            for record, strings in zip(records, encoded):
+                offsets = []
+                for blob in (record.thumbnail, record.metadata):
+                    if blob:
+                        offsets += [blob_offset, len(blob)]
+                        blobs.append(blob)
+                        blob_offset += len(blob)
+                    else:
+                        offsets += [0, 0]
+                fields = _RECORD_FIELDS.pack(record.repeat, *offsets)
+                f.write(_LENGTH.pack(len(fields) + len(strings)) + fields + strings)
+            for blob in blobs:
+                f.write(blob)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.replace(f.name, path)
+
+
+class SessionReader:
+    # Kayıtları istendikçe okur; kullanıcı arayüzü ilk satırları hemen
+    # gösterip kalanını parça parça yükleyebilir. Eski pickle oturumları
+    # okunurken yeni biçime dönüştürülür.
+    def __init__(self, path):
+        import json
+
+        self.path = path
+        self.legacy = False
+        self.f = open(path, 'rb')
+        try:
+            prefix = self.f.read(_SESSION_HEADER.size)
+            if prefix[:1] == b'\x80':
+                self._read_legacy()
+                return
+            if len(prefix) < _SESSION_HEADER.size or not prefix.startswith(SESSION_MAGIC):
+                raise ValueError(f"{path} is not a JFT session file")
+            _, self.version, _, header_len = _SESSION_HEADER.unpack(prefix)
+            if self.version > SESSION_VERSION:
+                raise ValueError(f"{path} was saved by a newer version of JFT")
+            self.header = json.loads(self.f.read(header_len).decode('utf-8'))
+            self.record_count = self.header.get('record_count', 0)
+        except BaseException:
+            self.f.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.f.close()
+
+    def records(self):
+        if self.legacy:
+            yield from self._legacy_records
+            return
+        for _ in range(self.record_count):
+            (record_len,) = _LENGTH.unpack(self._read(_LENGTH.size))
+            data = self._read(record_len)
+            repeat, thumb_offset, thumb_len, meta_offset, meta_len = _RECORD_FIELDS.unpack_from(data)
+            pos = _RECORD_FIELDS.size
+            strings = []
+            for _ in range(3):
+                (length,) = _LENGTH.unpack_from(data, pos)
+                pos += _LENGTH.size
+                strings.append(data[pos:pos + length].decode('utf-8'))
+                pos += length
+            record = SessionRecord(strings[0], strings[1], repeat, strings[2])
+            if thumb_len:
+                record.thumbnail_span = (thumb_offset, thumb_len)
+            if meta_len:
+                record.metadata_span = (meta_offset, meta_len)
+            yield record
+
+    def read_blob(self, span):
+        if not span or self.legacy:
+            return None
+        position = self.f.tell()
+        try:
+            self.f.seek(span[0])
+            return self._read(span[1])
+        finally:
+            self.f.seek(position)
+
+    def _read(self, size):
+        data = self.f.read(size)
+        if len(data) != size:
+            raise ValueError(f"{self.path} is truncated")
+        return data
+
+    def _read_legacy(self):
+        import pickle
+
+        self.f.seek(0)
+        try:
+            session_data = _legacy_unpickler(self.f).load()
+        except (pickle.UnpicklingError, EOFError) as e:
+            raise ValueError(f"{self.path} is not a valid session file: {e}")
+        self.legacy = True
+        self.version = 0
+        self._legacy_records = []
+        for entry in session_data.get('files', []):
+            # (item, path, filename, repeat, note) veya (item, path, filename, note)
+            if len(entry) == 5:
+                _, path, filename, repeat, note = entry
+            else:
+                _, path, filename, note = entry
+                repeat = 1
+            self._legacy_records.append(SessionRecord(path, filename, int(repeat), note or ''))
+        self.record_count = len(self._legacy_records)
+        self.header = {
+            'converter_type': session_data.get('converter_type'),
+            'sort_order': session_data.get('sort_order', True),
+            'record_count': self.record_count,
+        }
+
+
+def _legacy_unpickler(f):
+    import pickle
+
+    class SessionUnpickler(pickle.Unpickler):
+        # Eski oturumlar yalnızca yerleşik türler içerir; başka sınıf yüklenmez
+        def find_class(self, module, name):
+            raise pickle.UnpicklingError(f"Unsupported object in session file: {module}.{name}")
+
+    return SessionUnpickler(f)
+
+
+# Arayüzsüz dönüşümler; hem arayüz hem jft_cli bunları kullanır. progress(done)
+# her kare ya da dosyadan sonra çağrılır; on_error(path, error) atlanan dosya
+# için çağrılır, None ise hata yükseltilir.
+
+def frame_json(base_name, frame_number, image_data):
+    import datetime
+
+    return {
+        "name": f"Frame_{base_name}_{frame_number}",
+        "timestamp": int(datetime.datetime.now().timestamp() * 1000),
+        "soft": False,
+        "image_data": image_data
+    }
+
+
+class ExportStats:
+    __slots__ = ('frames', 'unique_frames', 'payload_bytes', 'output_bytes')
+
+    def __init__(self, frames=0, unique_frames=0, payload_bytes=0, output_bytes=0):
+        self.frames = frames
+        self.unique_frames = unique_frames
+        self.payload_bytes = payload_bytes  # benzersiz karelerin data URL uzunlukları toplamı
+        self.output_bytes = output_bytes
+
+    @property
+    def bytes_per_frame(self):
+        return self.payload_bytes / self.unique_frames if self.unique_frames else 0
+
+    def summary(self):
+        return (f"{self.frames} frames ({self.unique_frames} unique), "
+                f"{self.bytes_per_frame / 1024:.1f} KB per frame, "
+                f"{self.output_bytes / (1024 * 1024):.1f} MB total")
+
+
+def images_to_json(frames, output, names=None, workers=None, queue_size=None, cache=None,
+                   options=None, progress=None, on_error=None, cancel_event=None, resume=False):
+    # frames: (yol, tekrar) çiftleri. names kare adlarındaki temel adı verir;
+    # varsayılanı uzantısız dosya adıdır. cache, (path, mtime_ns, size,
+    # options) anahtarlı bir EncodedFrameCache'tir ve çağrılar arasında
+    # paylaşılabilir. resume=True ile ilerleme kaydedilir (bkz. ResumableOutput);
+    # yarıda kalan çalışma aynı girdilerle kaldığı yerden sürer, kesintinin iki
+    # yanında görülen içerik benzersiz kare sayısında iki kez sayılır.
+    # ExportStats döndürür.
+    frames = list(frames)
+    if names is None:
+        names = [os.path.splitext(os.path.basename(path))[0] for path, _ in frames]
+    cache = EncodedFrameCache() if cache is None else cache
+    options = options or ExportOptions()
+    signature = None
+    if resume:
+        signature = _input_signature([path for path, _ in frames], 'images-to-json',
+                                     [repeat for _, repeat in frames], names, options.to_dict())
+    with ResumableOutput(output, signature, text=True) as out:
+        stats = _write_images_json(out, frames, names, workers, queue_size, cache, options, progress,
+                                   on_error, cancel_event)
+    stats.output_bytes = os.path.getsize(output)
+    return stats
+
+
+def _write_images_json(out, frames, names, workers, queue_size, cache, options, progress, on_error,
+                       cancel_event):
+    # Devam ederken yazılmış kareler atlanır; sayaçlar kontrol noktasından gelir
+    state = out.state or {'written': 0, 'counters': {}, 'unique': 0, 'payload': 0}
+    start = out.position
+    import functools
+    import json
+
+    frames, names = frames[start:], names[start:]
+    keys = [_frame_key(path, on_error, options.key()) for path, _ in frames]
+    failed = set()
+    payload_sizes = {}  # kullanılan içerik özeti -> data URL uzunluğu
+
+    # Önbellekte olmayan dosyalar bir kez okunur; içerik özeti aynı baytlardan
+    # hesaplanır. Aynı içerikli dosyalardan yalnızca en önceki süreç havuzuna
+    # gönderilir, okuma ve kodlama yazmayla eşzamanlı sürer.
+    uncached = dict.fromkeys(key for key in keys if key and key not in cache)
+    claims = {}  # içerik özeti -> onu kodlayacak girdinin sırası
+    lock = threading.Lock()
+
+    def read(entry):
+        order, key = entry
+        digest, data = _read_keyed(key[0])
+        with lock:
+            first = claims.setdefault(digest, order)
+            if order < first:
+                # Sonraki bir girdi önce okundu; bu girdi de kodlar, sonuç önce bunu bekler
+                claims[digest] = first = order
+        return digest, data if first == order else None
+
+    pipeline = Pipeline(read, functools.partial(_encode_claimed, options=options), readers=4,
+                        workers=workers, queue_size=queue_size, processes=True, cancel_event=cancel_event)
+    digests = {}
+    broken = set()  # kodlanamayan içerik özetleri
+    encoded = EncodedFrameCache()  # içerik özeti -> (özet, data URL)
+    counters = state['counters']
+    written = state['written']
+
+    f = out.file
+    with contextlib.closing(pipeline.run(enumerate(uncached))) as results:
+        if not out.resumed:
+            f.write('[')
+        for index, (key, (path, repeat), base_name) in enumerate(zip(keys, frames, names), start):
+            # Önbellekten yazılan kareler havuza uğramaz; iptal burada da denetlenir
+            if cancel_event is not None and cancel_event.is_set():
+                raise ConversionCancelled()
+            if out.due():
+                out.checkpoint(index, {'written': written, 'counters': counters,
+                                       'unique': state['unique'] + len(payload_sizes),
+                                       'payload': state['payload'] + sum(payload_sizes.values())})
+            counters.setdefault(base_name, 0)
+            if key is None or key in failed:
+                continue
+            entry = cache.get(key)
+            if entry is None and key in uncached:
+                if key not in digests:
+                    # Sonuçlar uncached sırasıyla gelir; bir sonraki sonuç bu dosyaya aittir
+                    _, result, error = next(results)
+                    if error is not None:
+                        failed.add(key)
+                        _handle_error(on_error, path, error)
+                        continue
+                    digests[key], image_data, error = result
+                    if error is not None:
+                        broken.add(digests[key])
+                        failed.add(key)
+                        _handle_error(on_error, path, error)
+                        continue
+                    if image_data is not None and digests[key] not in encoded:
+                        # Yarışta iki kez kodlanan içerik ilk sonucu paylaşır
+                        encoded.put(digests[key], (digests[key], image_data))
+                if digests[key] in broken:
+                    # Aynı içerikli önceki dosya kodlanamadı; hata orada bildirildi
+                    failed.add(key)
+                    continue
+                entry = encoded.get(digests[key])
+            if entry is None:
+                # Kodlama önbellekten düştü; dosya yeniden okunup kodlanır
+                try:
+                    digest, data = _read_keyed(path)
+                    entry = (digest, encode_image_data(data, options))
+                except Exception as e:
+                    failed.add(key)
+                    _handle_error(on_error, path, e)
+                    continue
+                encoded.put(digest, entry)
+            if key not in cache:
+                cache.put(key, entry)
+
+            # Her görüntü tekrar sayısından bağımsız olarak bir kez kodlanır;
+            # data URL yalnızca ardışık tekrarları boyunca tutulur
+            digest, image_data = entry
+            payload_sizes[digest] = len(image_data)
+            for _ in range(repeat):
+                counters[base_name] += 1
+                if written:
+                    f.write(',')
+                json.dump(frame_json(base_name, counters[base_name], image_data), f)
+                written += 1
+                if progress:
+                    progress(written)
+        f.write(']')
+    return ExportStats(written, state['unique'] + len(payload_sizes),
+                       state['payload'] + sum(payload_sizes.values()))
+
+
+PALETTE_SAMPLES = 16
+
+
+def images_to_gif(frames, output, duration, optimize=False, progress=None, on_error=None,
+                  workers=None, cancel_event=None, resume=False):
+    # frames: (yol, tekrar) çiftleri; tekrarlar daha uzun süreli tek kare olur.
+    # optimize=True ile paleti listeden eşit aralıklarla seçilen karelerden
+    # kurulan OptimizedGifWriter kullanılır. resume images_to_json'daki gibidir.
+    # Yazılan kare sayısını döndürür.
+    frames = list(frames)
+    signature = None
+    if resume:
+        signature = _input_signature([path for path, _ in frames], 'images-to-gif',
+                                     [repeat for _, repeat in frames], duration, optimize)
+    with ResumableOutput(output, signature) as out, \
+            _gif_writer(out.file, optimize, lambda: _sample_image_frames(frames)) as writer:
+        start = out.position
+        done = sum(repeat for _, repeat in frames[:start])
+        if out.resumed:
+            writer.restore_state(out.state, lambda index: _open_image(frames[index][0], 'RGB'))
+        # Dosyalar okuyucularda okunup özetlenir, kareler işçilerde çözülüp kodlanır
+        stage = _GifFrameStage(writer, 'RGB')
+        pipeline = Pipeline(lambda frame: _read_keyed(frame[0]), stage.prepare, workers=workers,
+                            cancel_event=cancel_event)
+        with contextlib.closing(pipeline.run(frames[start:])) as results:
+            for index, ((path, repeat), result, error) in enumerate(results, start):
+                if out.due():
+                    out.checkpoint(index, writer.save_state())
+                if error is None:
+                    try:
+                        stage.write(result, duration * repeat, index)
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    _handle_error(on_error, path, error)
+                done += repeat
+                if progress:
+                    progress(done)
+    return writer.frame_count
+
+
+def json_to_gif(paths, output, duration, optimize=False, progress=None, on_error=None,
+                workers=None, cancel_event=None, resume=False):
+    # Kareler besleyici iş parçacığında ayrıştırılır, işçilerde çözülür. Yarıda
+    # hata veren dosya geri alınır; GIF yalnızca tam dosyaları içerir.
+    # resume=True ile dosyalar arasında kontrol noktası alınır. Kare sayısını
+    # döndürür.
+    paths = list(paths)
+    signature = None
+    if resume:
+        signature = _input_signature(paths, 'json-to-gif', duration, optimize)
+    with ResumableOutput(output, signature) as out, \
+            _gif_writer(out.file, optimize, lambda: _sample_json_frames(paths)) as writer:
+        start = done = out.position
+        if out.resumed:
+            writer.restore_state(out.state, lambda index: _json_frame(paths, index))
+        stage = _GifFrameStage(writer, 'RGBA')
+
+        def process(entry):
+            kind, _, image_data = entry
+            if kind != 'item':
+                return None
+            # Aynı image_data bir kez çözülüp kodlanır
+            return stage.prepare((content_digest(image_data.encode('ascii', 'replace')),
+                                  _decode_data_url(image_data)))
+
+        pipeline = Pipeline(process=process, workers=workers, cancel_event=cancel_event)
+        checkpoint, failed = None, False
+        # Karelerin konumu (dosya sırası, dosyadaki sırası) çiftidir
+        file_index, item_index = start - 1, 0
+        with contextlib.closing(pipeline.run(_file_items(paths[start:], _iter_image_data))) as results:
+            for (kind, path, payload), result, error in results:
+                if kind == 'start':
+                    file_index, item_index = file_index + 1, 0
+                    if out.due():
+                        out.checkpoint(file_index, writer.save_state())
+                    checkpoint, failed = writer.checkpoint(), False
+                    continue
+                if kind == 'end':
+                    done += 1
+                    if progress:
+                        progress(done)
+                    continue
+                if failed:
+                    continue
+                if kind == 'error':
+                    error = payload
+                elif error is None:
+                    try:
+                        stage.write(result, duration, [file_index, item_index])
+                    except Exception as e:
+                        error = e
+                    item_index += 1
+                if error is not None:
+                    writer.rollback(checkpoint)
+                    failed = True
+                    _handle_error(on_error, path, error)
+    return writer.frame_count
+
+
+class _GifFrameStage:
+    # GIF dönüşümlerinin işçi aşaması. prepare() işçilerde (key, data) çiftini
+    # çözer ve yazıcı izin veriyorsa kareyi yazıcının prepare()'iyle kodlar;
+    # başka işçinin üstlendiği içerik iki kez hazırlanmaz. write() sıralı
+    # yazıcıda çalışır; blok önbelleğine ya da kareyi kendisi çözmeye döner.
+    def __init__(self, writer, mode):
+        self.writer = writer
+        self.mode = mode
+        self.claim = isinstance(writer, GifWriter)
+        self._claimed = set()
+        self._lock = threading.Lock()
+
+    def prepare(self, source):
+        key, data = source
+        if self.claim:
+            with self._lock:
+                if key in self._claimed:
+                    return key, data, None
+                self._claimed.add(key)
+        return key, data, self.writer.prepare(self.decode(data))
+
+    def decode(self, data):
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as img:
+            return img.convert(self.mode)
+
+    def write(self, prepared, duration, index=None):
+        key, data, frame = prepared
+        if self.writer.write_cached(key, duration, index):
+            return
+        if frame is not None and self.writer.write_prepared(frame, duration, key, index):
+            return
+        self.writer.write(self.decode(data), duration, key, index)
+
+
+def _open_image(path, mode):
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return img.convert(mode)
+
+
+def _json_frame(paths, index):
+    # json_to_gif konumundaki kareyi dosyasını baştan okuyarak, aşamanın kipinde çözer
+    from PIL import Image
+
+    file_index, item_index = index
+    for n, image_data in enumerate(_iter_image_data(paths[file_index])):
+        if n == item_index:
+            with Image.open(io.BytesIO(_decode_data_url(image_data))) as img:
+                return img.convert('RGBA')
+    raise ValueError(f"Frame {item_index} not found in {paths[file_index]}")
+
+
+def _read_keyed(path):
+    data = read_file(path)
+    return content_digest(data), data
+
+
+def _decode_data_url(image_data):
+    import base64
+
+    _, base64_data = image_data.split(',', 1)
+    return base64.b64decode(base64_data)
+
+
+def _iter_image_data(path):
+    for item in iter_json_items(path):
+        image_data = item.get('image_data', '')
+        if image_data.startswith('data:image/'):
+            yield image_data
+
+
+def _file_items(paths, read_items):
+    # Dosya sınırlarını ('start'/'end') ve okuma hatalarını ('error') öğe akışına katar
+    for path in paths:
+        yield 'start', path, None
+        try:
+            for item in read_items(path):
+                yield 'item', path, item
+        except Exception as e:
+            yield 'error', path, e
+        yield 'end', path, None
+
+
+def iter_image_frames(frames, duration):
+    # Önizleme kaynağı: kareler GIF'e kodlanmadan (RGB kare, süre) olarak verilir.
+    # Açılamayan dosyalar atlanır; hatalar kaydederken yapılan dönüşümde bildirilir.
+    from PIL import Image
+
+    for path, repeat in frames:
+        try:
+            with Image.open(path) as img:
+                frame = img.convert('RGB')
+        except Exception:
+            continue
+        yield frame, duration * repeat
+
+
+def iter_json_frames(paths, duration):
+    # iter_image_frames gibi; JSON dosyalarındaki kareler sırayla çözülür
+    import base64
+    from PIL import Image
+
+    for path in paths:
+        try:
+            for item in iter_json_items(path):
+                image_data = item.get('image_data', '')
+                if not image_data.startswith('data:image/'):
+                    continue
+                _, base64_data = image_data.split(',', 1)
+                with Image.open(io.BytesIO(base64.b64decode(base64_data))) as img:
+                    frame = img.convert('RGBA')
+                yield frame, duration
+        except Exception:
+            continue
+
+
+def _gif_writer(fp, optimize, sample):
+    if not optimize:
+        return GifWriter(fp)
+    return OptimizedGifWriter(fp, sample())
+
+
+def _palette_sample(img):
+    # Örnek çözülür çözülmez küçültülür; bellekte tam boyutlu tek kare bulunur.
+    # build_gif_palette aynı küçültmeyi yaptığından palet değişmez.
+    from PIL import Image
+
+    sample = img.convert('RGB')
+    size = OptimizedGifWriter.SAMPLE_SIZE
+    sample.thumbnail((size, size), Image.Resampling.NEAREST)
+    return sample
+
+
+def _sample_image_frames(frames, count=PALETTE_SAMPLES):
+    from PIL import Image
+
+    step = max(len(frames) / count, 1)
+    samples = []
+    for path, _ in (frames[int(i * step)] for i in range(min(count, len(frames)))):
+        try:
+            with Image.open(path) as img:
+                samples.append(_palette_sample(img))
+        except Exception:
+            continue
+    return samples
+
+
+def _sample_json_frames(paths, count=PALETTE_SAMPLES):
+    # Dosyalar eşit aralıklarla seçilir; her birinin ilk kareleri okunur
+    import base64
+    from PIL import Image
+
+    step = max(len(paths) / count, 1)
+    chosen = [paths[int(i * step)] for i in range(min(count, len(paths)))]
+    per_file = -(-count // max(len(chosen), 1))
+    samples = []
+    for path in chosen:
+        try:
+            taken = 0
+            for item in iter_json_items(path):
+                image_data = item.get('image_data', '') if isinstance(item, dict) else ''
+                if not image_data.startswith('data:image/'):
+                    continue
+                _, base64_data = image_data.split(',', 1)
+                with Image.open(io.BytesIO(base64.b64decode(base64_data))) as img:
+                    samples.append(_palette_sample(img))
+                taken += 1
+                if taken >= per_file:
+                    break
+        except Exception:
+            continue
+    return samples
+
+
+def merge_json(paths, output, fast=True, progress=None, on_error=None, cancel_event=None,
+               resume=False):
+    # fast=True ile öğeler çözülmeden ham bayt olarak kopyalanır. Dosyalar
+    # besleyici iş parçacığında ayrıştırılırken önceki öğeler yazılır.
+    # resume=True ile dosyalar arasında kontrol noktası alınır. Yazılan öğe
+    # sayısını döndürür.
+    import json
+
+    if fast:
+        read_items = iter_raw_json_items
+    else:
+        def read_items(path):
+            return (json.dumps(item).encode() for item in iter_json_items(path))
+    paths = list(paths)
+    signature = _input_signature(paths, 'merge-json', fast) if resume else None
+    pipeline = Pipeline(queue_size=16, cancel_event=cancel_event)
+    with ResumableOutput(output, signature) as out:
+        f = out.file
+        done = out.position
+        written = out.state['written'] if out.resumed else 0
+        entries = pipeline.run(_file_items(paths[done:], read_items))
+        with contextlib.closing(entries):
+            if not out.resumed:
+                f.write(b'[')
+            for (kind, path, payload), _, _ in entries:
+                if kind == 'start':
+                    if out.due():
+                        out.checkpoint(done, {'written': written})
+                    file_start, file_written = f.tell(), written
+                elif kind == 'item':
+                    if written:
+                        f.write(b',')
+                    f.write(payload)
+                    written += 1
+                elif kind == 'error':
+                    # Hatalı bir dosyanın yarım kalan öğeleri geri alınır
+                    f.seek(file_start)
+                    f.truncate()
+                    written = file_written
+                    _handle_error(on_error, path, payload)
+                else:
+                    done += 1
+                    if progress:
+                        progress(done)
+            f.write(b']')
+    return written
+
+
+def _frame_key(path, on_error, options_key):
+    try:
+        stat = os.stat(path)
+        return (path, stat.st_mtime_ns, stat.st_size, options_key)
+    except OSError as e:
+        _handle_error(on_error, path, e)
+        return None
+
+
+def _handle_error(on_error, path, error):
+    if on_error is None:
+        raise error
+    on_error(path, error)
+
+
+class ResumableOutput:
+    # Yarıda kalan çalışmanın kaldığı yerden sürebildiği dönüşüm çıktısı. Veri
+    # "<output>.part"a yazılır; checkpoint() veriyi diske aktarır, bayt
+    # konumunu, sıradaki girdinin konumunu ve dönüşüm durumunu
+    # "<output>.part.json"a kaydeder. İptal edilen, hata veren ya da öldürülen
+    # çalışma iki dosyayı da bırakır; aynı imzalı sonraki çalışma kısmi dosyayı
+    # o konuma kırpar ve `position`, `state` ile başlar. Başarıda kısmi dosya
+    # çıktının yerine geçer, kontrol noktası silinir.
+    #
+    # İmza yoksa devam edilmez: çıktı benzersiz adlı geçici bir dosyaya yazılır
+    # ve hata olursa silinir.
+    INTERVAL = 2.0  # kontrol noktaları arası saniye
+    VERSION = 1
+
+    def __init__(self, output, signature=None, text=False, interval=None):
+        self.output = output
+        self.signature = signature
+        self.text = text
+        self.interval = self.INTERVAL if interval is None else interval
+        self.part_path = output + '.part'
+        self.checkpoint_path = self.part_path + '.json'
+        self.position = 0
+        self.state = None  # devam edilmiyorsa None
+        self.file = None
+        self._raw = None
+        self._saved = False
+        self._last = 0.0
+
+    def __enter__(self):
+        if self.signature is None:
+            import tempfile
+
+            fd, self.part_path = tempfile.mkstemp('.tmp', dir=os.path.dirname(os.path.abspath(self.output)))
+            self._raw = os.fdopen(fd, 'wb')
+        else:
+            self._raw = self._open_part()
+        if self.text:
+            self.file = io.TextIOWrapper(self._raw, encoding='utf-8', newline='', write_through=True)
+        else:
+            self.file = self._raw
+        self._last = time.monotonic()
+        return self
+
+    def _open_part(self):
+        saved = self._load()
+        if saved is not None:
+            try:
+                raw = open(self.part_path, 'r+b')
+            except OSError:
+                pass
+            else:
+                if os.fstat(raw.fileno()).st_size >= saved['offset']:
+                    raw.seek(saved['offset'])
+                    raw.truncate()
+                    self.position, self.state = saved['position'], saved['state']
+                    self._saved = True
+                    return raw
+                raw.close()
+        # Eşleşmeyen eski kontrol noktası yeni çıktıya uygulanmasın
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.checkpoint_path)
+        return open(self.part_path, 'wb')
+
+    def _load(self):
+        import json
+
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(saved, dict) or saved.get('version') != self.VERSION
+                or saved.get('signature') != self.signature):
+            return None
+        return saved
+
+    @property
+    def resumed(self):
+        return self.state is not None
+
+    def due(self):
+        return self.signature is not None and time.monotonic() - self._last >= self.interval
+
+    def checkpoint(self, position, state):
+        # Veri diske yazıldıktan sonra kontrol noktası atomik olarak değiştirilir
+        import json
+
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        saved = {'version': self.VERSION, 'signature': self.signature, 'offset': self._raw.tell(),
+                 'position': position, 'state': state}
+        temp_path = self.checkpoint_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+        os.replace(temp_path, self.checkpoint_path)
+        self._saved = True
+        self._last = time.monotonic()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.file.close()
+        if exc_type is None:
+            os.replace(self.part_path, self.output)
+            if self.signature is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(self.checkpoint_path)
+        elif not self._saved:
+            # Devam edilecek bir şey yok
+            os.remove(self.part_path)
+        return False
+
+
+def _input_signature(paths, *settings):
+    # Devam yalnızca aynı girdiler ve ayarlarla yapılır; dosyalar yol, boyut ve
+    # mtime ile tanınır
+    import json
+
+    files = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            files.append([path, stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            files.append([path, None, None])
+    return content_digest(json.dumps([files, settings]).encode()).hex()
@@ -0,0 +1,53 @@
+import io
+
+from PIL import Image, ImageChops, ImageDraw, ImageSequence
+
+import jft_engine
+
+# Varsayılan GIF yolu Pillow'un çok kareli kaydı gibi yalnızca değişen
+# dikdörtgeni yazmalıdır; çoğu sabit bir dizide boyut ona yakın kalır.
+
+
+def make_frames(tmp_path, count=12, size=(320, 240)):
+    base = Image.effect_noise(size, 40).convert('RGB')
+    frames = []
+    for n in range(count):
+        frame = base.copy()
+        ImageDraw.Draw(frame).rectangle((n * 10, 60, n * 10 + 60, 120), fill=(255, 0, 0))
+        path = tmp_path / f'{n}.png'
+        frame.save(path)
+        frames.append((str(path), 1))
+    return frames
+
+
+def decoded(data):
+    with Image.open(io.BytesIO(data)) as gif:
+        return [frame.convert('RGB') for frame in ImageSequence.Iterator(gif)]
+
+
+def test_mostly_static_sequence_stays_close_to_pillow(tmp_path):
+    frames = make_frames(tmp_path)
+    images = [Image.open(path).convert('RGB') for path, _ in frames]
+    baseline = io.BytesIO()
+    images[0].save(baseline, format='GIF', save_all=True, append_images=images[1:], duration=100, loop=0,
+                   optimize=False)
+
+    output = tmp_path / 'out.gif'
+    assert jft_engine.images_to_gif(frames, str(output), 100) == len(frames)
+    data = output.read_bytes()
+    assert len(data) <= len(baseline.getvalue()) * 1.1
+
+    expected = decoded(baseline.getvalue())
+    actual = decoded(data)
+    assert len(actual) == len(expected)
+    for want, got in zip(expected, actual):
+        assert ImageChops.difference(want, got).getbbox() is None
+
+
+def test_identical_frames_are_merged(tmp_path):
+    frames = make_frames(tmp_path, count=3)
+    frames = [frames[0], frames[0], frames[1]]
+    output = tmp_path / 'out.gif'
+    assert jft_engine.images_to_gif(frames, str(output), 100) == 2
+    with Image.open(output) as gif:
+        assert gif.info['duration'] == 200
@@ -0,0 +1,88 @@
+import io
+import json
+
+import pytest
+
+import jft_engine
+
+# Akışlı JSON okuyucuları: küçük chunk_size ile her belirteç parça sınırına
+# düşer; ham okuyucu çözülmüş okuyucuyla aynı öğeleri vermelidir.
+
+CHUNK_SIZES = [1, 2, 3, 7, 1 << 20]
+
+SHAPES = [
+    ('[1, {"a": 2}, "x"]', [1, {'a': 2}, 'x']),
+    ('{"version": 3, "data": [1, {"a": 2}], "extra": true}', [1, {'a': 2}]),
+    ('{"data": {"a": 1}}', [{'a': 1}]),
+    ('{"a": 1, "b": [2, 3]}', [{'a': 1, 'b': [2, 3]}]),
+    ('[]', []),
+    ('{"data": []}', []),
+    ('{}', [{}]),
+    ('42', [42]),
+]
+
+TRICKY = ('\ufeff \r\n[ "a\\"b,]}" ,\t{"k" : "\\u00e9 [x] {y}", "n": [ ]} ,\n'
+          ' 12.5e+3 , -0 , "\\\\" , null ]\n')
+
+
+def write(tmp_path, text, name='items.json'):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def raw_items(path):
+    return [json.loads(bytes(item)) for item in jft_engine.iter_raw_json_items(path)]
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+@pytest.mark.parametrize('text, expected', SHAPES)
+def test_shapes(tmp_path, text, expected, chunk_size):
+    path = write(tmp_path, text)
+    assert list(jft_engine.iter_json_items(path, chunk_size)) == expected
+    assert raw_items(path) == expected
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_whitespace_and_escapes(tmp_path, chunk_size):
+    path = write(tmp_path, TRICKY)
+    expected = json.loads(TRICKY.lstrip('\ufeff'))
+    assert list(jft_engine.iter_json_items(path, chunk_size)) == expected
+    assert raw_items(path) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3])
+def test_reader_values_split_across_chunks(chunk_size):
+    reader = jft_engine._JsonStreamReader(io.StringIO('[123456789, -1.5e+10, "long string"]'), chunk_size)
+    assert list(reader.array_items()) == [123456789, -1.5e+10, 'long string']
+    assert reader.peek() is None
+
+
+def test_reader_reports_truncated_value():
+    reader = jft_engine._JsonStreamReader(io.StringIO('"unterminated'), 2)
+    with pytest.raises(ValueError):
+        reader.value()
+
+
+@pytest.mark.parametrize('text', ['[1 2]', '[1, 2', '{"data": [1,}', '[1] [2]', '{"a" 1}'])
+def test_malformed_files_raise(tmp_path, text):
+    path = write(tmp_path, text)
+    for chunk_size in (1, 1 << 20):
+        with pytest.raises(ValueError):
+            list(jft_engine.iter_json_items(path, chunk_size))
+    with pytest.raises(ValueError):
+        raw_items(path)
+
+
+@pytest.mark.parametrize('fast', [True, False])
+def test_merge_rolls_back_a_file_that_fails_part_way(tmp_path, fast):
+    good = write(tmp_path, '[1, {"a": "b"}]', 'good.json')
+    bad = write(tmp_path, '{"data": [2, 3 4]}', 'bad.json')
+    last = write(tmp_path, '{"data": [4]}', 'last.json')
+    errors = []
+    output = tmp_path / 'merged.json'
+    written = jft_engine.merge_json([good, bad, last], str(output), fast=fast,
+                                    on_error=lambda path, error: errors.append(path))
+    assert written == 3
+    assert json.loads(output.read_text()) == [1, {'a': 'b'}, 4]
+    assert errors == [bad]